@@ -30,7 +30,7 @@ class BeamSearch(Random):
 
     def reset_model(self) -> None:
         """Reset the model and queue of the BeamSearch class."""
-        self.initial_model = Model()
+        self.initial_model = self.initial_model.empty_like()
         self.queue = []
 
     def get_next_state(self) -> Model:
@@ -40,7 +40,7 @@ class BeamSearch(Random):
 
     def get_tot_penalty_possibilities(
         self, model: Model, index: int, n: int
-    ) -> list[tuple[str, str]]:
+    ) -> list[int]:
         """Gets n possible activities that would fit in specific index of a model.
         Possibilities are selected according to the total penalty.
 
@@ -50,14 +50,14 @@ class BeamSearch(Random):
             n (int): The beam width, how many possible activities should be returned.
 
         Returns:
-            list[Tuple(str,str)]: A list with activity tuples of length n.
+            list[int]: A list with activity ids of length n.
         """
         possibilities = {}
 
         # Check if activity capacity matches hall capacity
         for activity in model.unassigned_activities:
             model.add_activity(index, activity)
-            penalty = model.calc_total_penalty()
+            penalty = model.get_penalty_points()
 
             possibilities.update({activity: penalty})
 
@@ -67,7 +67,7 @@ class BeamSearch(Random):
 
     def get_capacity_possibilities(
         self, model: Model, index: int, n: int
-    ) -> list[tuple[str, str]]:
+    ) -> list[int]:
         """Get n possible activities that would fit in specific index of a model.
 
         Possibilities are selected as possibilities according to capacity.
@@ -78,7 +78,7 @@ class BeamSearch(Random):
             n (int): The beam width specifying amount of possible activities to be returned.
 
         Returns:
-            list[Tuple(str,str)]: A list with activity tuples of length n.
+            list[int]: A list with activity ids of length n.
         """
         possibilities = {}
         no_possibilities = {}
@@ -98,7 +98,7 @@ class BeamSearch(Random):
 
     def sort_possibilities(
         self, n: int, possibilities: dict, no_possibilities={}, heuristic="capacity"
-    ) -> list[tuple[str, str]]:
+    ) -> list[int]:
         """Sort all possibilities according to heuristic and returns them.
 
         Args:
@@ -108,7 +108,7 @@ class BeamSearch(Random):
             heuristic (str): Defaults to  'capacity', second option is "totalpenalty".
 
         Returns:
-            list[Tuple(str,str)]: A list with activity tuples of length n.
+            list[int]: A list with activity ids of length n.
         """
 
         # If there are possibilities
@@ -132,7 +132,7 @@ class BeamSearch(Random):
 
     def get_possibilities(
         self, model: Model, index: int, n: int, heuristic="random"
-    ) -> list[tuple[str, str]]:
+    ) -> list[int]:
         """Get n possible activities that would fit in specific index of a model.
 
         Possibilities are be calculated according to heuristic.
@@ -145,7 +145,7 @@ class BeamSearch(Random):
                 Options are "random", "capacity", "totalpenalty". Defaults to 'random'.
 
         Returns:
-            list[Tuple(str,str)]: A list with activity tuples of length n.
+            list[int]: A list with activity ids of length n.
 
         """
 
@@ -177,7 +177,7 @@ class BeamSearch(Random):
         Returns:
             priority (int): A priority score of the model.
         """
-        penalty = model.calc_total_penalty()
+        penalty = model.get_penalty_points()
         unassigned = len(model.unassigned_activities)
 
         return penalty + (unassigned * 40)
@@ -228,12 +228,13 @@ class BeamSearch(Random):
 
         """
         runtime = time.time() - start_time
+        breakdown = self.initial_model.get_penalty_breakdown()
 
         with open(f"results/BeamSearch/beam_search_runtime.txt", "a+") as file:
             file.write(
                 f"\nHeuristic: {heuristic}, Beam: {beam}, Runtime: {runtime}, Runs: {runs} \n"
-                f"total penalty: {self.initial_model.calc_total_penalty()}, capacity penalty: {self.initial_model.calc_total_capacity_penalties()}, evening penalty: {self.initial_model.calc_evening_penalties()} \n"
-                f"student penalty: {self.initial_model.calc_student_schedule_penalties()} \n"
+                f"total penalty: {breakdown.total}, capacity penalty: {breakdown.capacity}, evening penalty: {breakdown.evening} \n"
+                f"student penalty: {breakdown.student_penalties()} \n"
                 f"correct solution: {self.initial_model.is_solution()}\n"
             )
 
@@ -23,7 +23,7 @@ class Greedy:
             sort_overlap (bool) : to optionally sort activities by amount of overlap with other activities.
         """
         self.model = empty_model.copy()
-        self.empty_slots = list(self.model.solution.keys())
+        self.empty_slots = list(range(len(self.model.schedule)))
         if shuffle:
             self.model.shuffle_activities()
         elif sort:
@@ -35,7 +35,7 @@ class Greedy:
         """Finds the best index for a given activity based on penalty points.
 
         Args:
-            activity (tuple): Activity to find the optimal index for.
+            activity (int): Id of the activity to find the optimal index for.
             current_penalty (int): Penalty points of the current model.
 
         Returns:
@@ -47,7 +47,7 @@ class Greedy:
         lowest_penalty = sys.maxsize
         for index in self.empty_slots:
             self.model.add_activity(index, activity)
-            new_penalty = self.model.calc_total_penalty()
+            new_penalty = self.model.get_penalty_points()
 
             # if penalty unchanged, optimal index is found
             if new_penalty == current_penalty:
@@ -67,7 +67,7 @@ class Greedy:
         """Inserts activity greedily.
 
         Args:
-            activity (tuple): activity to be inserted.
+            activity (int): id of the activity to be inserted.
             current_penalty (int): total penalty before insertion.
 
         Returns:
@@ -106,37 +106,22 @@ class RandomGreedy(Greedy):
     Combines random and greedy choices to contructively generate a schedule.
     """
 
-    def insert_randomly(self, activity) -> int:
+    def insert_randomly(self, activity, max_difference=5) -> int:
         """Inserts activity at random index while considering room size.
 
         Args:
-            activity (tuple): activity to be inserted.
+            activity (int)      : id of the activity to be inserted.
+            max_difference (int): max difference allowed between #students in activity and room capacity.
 
         Returns:
             (int) total penalty after insertion.
         """
-        overflow = True
-        while overflow:
-            index = self.model.get_random_index(empty=True)
-            overflow = self.capacity_overflow(index, activity)
+        # Only indices with a capacity penalty of at most max_difference are considered.
+        min_capacity = self.model.get_student_count_in_activity(activity) - max_difference
+        index = self.model.get_random_empty_index_with_capacity(min_capacity)
         self.model.add_activity(index, activity)
         self.update_empty_slots(index)
-        return self.model.calc_total_penalty()
-
-    def capacity_overflow(self, index, activity, max_difference=5) -> bool:
-        """Checks if insertion causes an unreasonable capacity penalty.
-
-        Args:
-            index (int)         : where activity would be inserted.
-            activity (tuple)    : activity to insert in room.
-            max_difference (int): max difference allowed between #students in activity and room capacity.
-
-        Returns:
-            bool: True if activity exceeds room capacity too much, False if not.
-        """
-        if self.model.calc_capacity_penalty_at_(index, activity) > max_difference:
-            return True
-        return False
+        return self.model.get_penalty_points()
 
     def calc_random_chance(self, i, start=0.7, alpha=0.064) -> float:
         """Calculates the probability of a random insertion based on a exponential.
@@ -95,17 +95,14 @@ class HillClimber(Random):
         Returns:
             np.array: A list[float] of the increased scores after modification.
         """
-        new_scores: list[float] = []
-        for index, score in new_model.get_index_penalty_dict().items():
-            if 1 <= new_model.translate_index(index)["timeslot"] <= 2:
-                # Only timeslot 1 and 2 should recieve increased weights.
-                # Ensures modifier also applying on slots with no penalty score.
-                new_weights = (score + 1) * modifier
-                new_scores.append(new_weights)
-            else:
-                new_scores.append(score)
+        scores = new_model.penalty_per_index
+        timeslots = new_model.geometry.slot_timeslot
 
-        return np.array(new_scores)
+        # Only timeslot 1 and 2 should recieve increased weights.
+        # Ensures modifier also applying on slots with no penalty score.
+        return np.where(
+            (1 <= timeslots) & (timeslots <= 2), (scores + 1) * modifier, scores
+        )
 
     def increase_weight_of_days(
         self, new_model: Model, day: int, modifier: float = 1.2
@@ -121,18 +118,13 @@ class HillClimber(Random):
         Returns:
             np.array: A list[float] of the increased scores after modification.
         """
-        new_weights: list[float] = []
-
-        for index, score in new_model.get_index_penalty_dict().items():
-            if new_model.translate_index(index)["day"] == day:
-                # Only increase the weights of the correct day.
-                # Ensures modifier also applying on slots with no penalty score.
-                new_score = (score + 1) * modifier
-                new_weights.append(new_score)
-            else:
-                new_weights.append(score)
+        scores = new_model.penalty_per_index
 
-        return np.array(new_weights)
+        # Only increase the weights of the correct day.
+        # Ensures modifier also applying on slots with no penalty score.
+        return np.where(
+            new_model.geometry.slot_day == day, (scores + 1) * modifier, scores
+        )
 
     def heuristic_balancing(
         self,
@@ -164,9 +156,7 @@ class HillClimber(Random):
         # Initiate a list based on the stored index penalty scores.
         # Is initiated as an np.array because indices of two lists may need to be summed:
         # E.G: [2, 1] + [4, 5] = [6, 6].
-        new_scores: np.array = np.array(
-            list(new_model.get_index_penalty_dict().values())
-        )
+        new_scores: np.array = new_model.penalty_per_index.copy()
 
         if centre_placement is True:
             new_scores = self.increase_centre_weight(new_model, modifier)
@@ -193,13 +183,13 @@ class HillClimber(Random):
 
         return push_map, pull_map
 
-    def swap_slots(
+    def select_swap(
         self,
         new_model: Model,
         push_map: Optional[np.array] = None,
         pull_map: Optional[np.array] = None,
-    ) -> None:
-        """Swap two slots in the model at random.
+    ) -> tuple[int, int]:
+        """Select two slots in the model to swap at random.
 
         The push_map and the pull_map respectively increase
         the weight of high and low penalty locations.
@@ -212,22 +202,25 @@ class HillClimber(Random):
             pull_map (np.array): A list of weights for each index.
                 Higher weights at an index means a greater likelihood the index is selected.
                 Defaults to None. Every index will then receive the same weight.
+
+        Returns:
+            tuple[int, int]: The two indices to be swapped.
         """
         # Select two random indices to swap.
         index_1 = new_model.get_random_index(weights=push_map)
         index_2 = new_model.get_random_index(weights=pull_map)
 
-        new_model.swap_activities(index_1, index_2)
+        return index_1, index_2
 
-    def mutate_model(
+    def select_swaps(
         self,
         new_model: Model,
         number_of_swaps: int = 1,
         heuristics: Optional[list[str]] = None,
         modifier: float = 1.2,
         steepest: bool = False,
-    ) -> None:
-        """Swap a number of indices.
+    ) -> list[tuple[int, int]]:
+        """Select a number of pairs of indices to swap.
 
         Args:
             new_model (Model): A copy of the currently stored model with mutations.
@@ -245,6 +238,9 @@ class HillClimber(Random):
                         or pulled from.
             steepest (bool): Evaluate if algorithm has to only take each steepest climb.
                     Defaults to False. Will result in deterministic algorithm behaviour.
+
+        Returns:
+            list[tuple[int, int]]: The pairs of indices to be swapped in order.
         """
         push_map = None
         pull_map = None
@@ -269,8 +265,53 @@ class HillClimber(Random):
                     steepest=steepest,
                 )
 
-        for _ in range(number_of_swaps):
-            self.swap_slots(new_model, push_map=push_map, pull_map=pull_map)
+        return [
+            self.select_swap(new_model, push_map=push_map, pull_map=pull_map)
+            for _ in range(number_of_swaps)
+        ]
+
+    def mutate_model(
+        self,
+        new_model: Model,
+        number_of_swaps: int = 1,
+        heuristics: Optional[list[str]] = None,
+        modifier: float = 1.2,
+        steepest: bool = False,
+    ) -> list[tuple[int, int]]:
+        """Swap a number of indices, selected with select_swaps.
+
+        The penalty of the model is updated incrementally, only re-evaluating
+        the swapped indices and the students enrolled in the swapped activities.
+
+        Returns:
+            list[tuple[int, int]]: The pairs of indices that were swapped.
+        """
+        swaps = self.select_swaps(
+            new_model, number_of_swaps, heuristics, modifier, steepest
+        )
+        new_model.apply_swaps(swaps)
+
+        return swaps
+
+    def draw_threshold(self) -> float:
+        """Return the change in penalty points a mutation has to stay below to be accepted.
+
+        The threshold is known before the mutation is evaluated, so the evaluation
+        can stop as soon as the change is certain to reach it.
+        The HillClimber only accepts improvements.
+        """
+        return 0
+
+    def accept_mutation(self, penalty_delta: int) -> bool:
+        """Accept mutations which decrease the penalty score.
+
+        Args:
+            penalty_delta (int): Change in penalty points caused by the mutation.
+
+        Returns:
+            bool: True if the mutation is accepted, else False.
+        """
+        return penalty_delta < 0
 
     def run(
         self,
@@ -314,6 +355,12 @@ class HillClimber(Random):
 
         self.iterations = iterations
 
+        # Mutate a private copy in place, keeping the initial model intact.
+        self.best_model = self.best_model.copy()
+
+        # The weights need the penalties per index, which a memo hit does not fill.
+        self.best_model.update_penalty_tables()
+
         scores: list[int] = []
 
         convergence_counter = 0
@@ -327,16 +374,27 @@ class HillClimber(Random):
                 end="\r",
             ) if verbose else None
 
-            # Create a copy of the model to simulate a mutation.
-            new_model = self.best_model.copy()
-
-            self.mutate_model(new_model, mutate_slots_number, heuristics, modifier)
-
-            # Update the score of the model.
-            new_model.calc_total_penalty()
+            swaps = self.select_swaps(
+                self.best_model, mutate_slots_number, heuristics, modifier
+            )
+            threshold = self.draw_threshold()
+            # Simulate a mutation in a transaction, which also updates the score.
+            # The evaluation stops early if the mutation cannot be accepted,
+            # which is rejected like an infinite delta.
+            previous_penalty = self.best_model.penalty_points
+            self.best_model.begin()
+            penalty_points = self.best_model.apply_swaps(swaps, threshold)
+            accepted = self.accept_mutation(
+                math.inf if penalty_points is None else penalty_points - previous_penalty
+            )
+            if accepted:
+                # Keep the mutation if it is an improvement.
+                self.best_model.commit()
+            else:
+                # Undo the rejected mutation.
+                self.best_model.rollback()
 
-            if self.check_solution(new_model) is True:
-                # Accept the mutation if it is an improvement.
+            if accepted:
                 convergence_counter = 0
             elif convergence_counter > convergence:
                 # Assume convergence has occured when solution remains the same for
@@ -23,6 +23,7 @@ def random_restart(
     verbose: int = 0,
     save: bool = False,
     store_runs: bool = False,
+    empty_model: Optional[Model] = None,
 ):
     """Random Restart is a meta algorithm for a HillClimber or Simulated Annealing.
 
@@ -63,10 +64,13 @@ def random_restart(
             Will store files in /libraries/results/random_restart/<class algorithm version> model and scores.
         store_runs (bool): Evaluate if a list of scores for each run is to be returned instead of the best model.
             Defaults to false.
+        empty_model (Model): Empty model from which the starting models are made,
+            sharing its problem instance, score cache and verifier. Defaults to None,
+            in which case a new model is loaded.
     """
     run_scores = []
     random.seed(seed)
-    best_model = Model()
+    best_model = empty_model.empty_like() if empty_model is not None else Model()
 
     verbosity = True if verbose >= 2 else False
     print(f"Starting PID Number {os.getpid()}")
@@ -75,7 +79,7 @@ def random_restart(
     for run in range(runs):
         start_time = time.time()
         # Generate a new random model.
-        random_model = Random(Model()).run()
+        random_model = Random(best_model.empty_like()).run()
         print(
             "\033[A",  # Go back 2 lines.
             f"Run {run}/{runs}, current penalty score: {best_model.penalty_points}",
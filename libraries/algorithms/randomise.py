@@ -1,5 +1,6 @@
 from random import randrange
 from libraries.classes.model import Model
+import numpy as np
 
 
 class Random:
@@ -20,7 +21,7 @@ class Random:
         """Insert activity in random slot."""
         # while-loop ensures activity is added
         while True:
-            random_slot = randrange(145)
+            random_slot = randrange(new_model.geometry.n_slots)
             if new_model.add_activity(random_slot, activity_tuple) is True:
                 break
 
@@ -39,23 +40,23 @@ class Random:
             return True
         return False
 
-    def run(self, runs: int = 1, verbose: bool = False) -> Model:
-        """Generate random schedule x times and return the one with the lowest penalty score.
+    def generate_schedules(self, runs: int, verbose: bool = False) -> np.ndarray:
+        """Generate random schedules from the initial model without scoring them.
 
         Args:
-            runs (int): Number of runs to be performed in search of a better schedule.
-                Defaults to 1.
+            runs (int): Number of schedules to generate.
             verbose (bool): Evaluate if progress has to be displayed in the terminal.
                 Defaults to false.
 
         Returns:
-            Model: The model with the lowest penalty score.
+            np.ndarray: Array of shape (runs, indices) containing the activity ids
+                of each schedule, -1 for an empty index.
         """
-        self.runs = runs
+        schedules = np.empty((runs, len(self.initial_model.schedule)), dtype=int)
 
         for run in range(runs):
             print(
-                f"Run {run}/{runs}, current penalty score: {self.best_model.penalty_points}      ",
+                f"Run {run}/{runs}, generating schedules      ",
                 end="\r",
             ) if verbose else None
 
@@ -66,6 +67,39 @@ class Random:
             for activity in new_model.activity_enrollments:
                 self.insert_randomly(activity, new_model)
 
+            schedules[run] = new_model.schedule
+
+        return schedules
+
+    def run(self, runs: int = 1, verbose: bool = False) -> Model:
+        """Generate random schedule x times and return the one with the lowest penalty score.
+
+        All schedules are scored at once through Model.calc_penalty_breakdowns.
+
+        Args:
+            runs (int): Number of runs to be performed in search of a better schedule.
+                Defaults to 1.
+            verbose (bool): Evaluate if progress has to be displayed in the terminal.
+                Defaults to false.
+
+        Returns:
+            Model: The model with the lowest penalty score.
+        """
+        self.runs = runs
+
+        schedules = self.generate_schedules(runs, verbose)
+        penalties = [
+            breakdown.total
+            for breakdown in self.initial_model.calc_penalty_breakdowns(schedules)
+        ]
+
+        # Without runs, the best model stays the initial model.
+        if penalties:
+            # First schedule with the lowest penalty, as if accepted run by run.
+            best_run = penalties.index(min(penalties))
+            new_model = self.initial_model.copy()
+            new_model.load_schedule(schedules[best_run])
+
             # Update penalty points of new model.
             new_model.calc_total_penalty()
 
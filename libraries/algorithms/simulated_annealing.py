@@ -35,6 +35,9 @@ class SimulatedAnnealing(HillClimber):
         self.T0 = temperature
         self.T = temperature
 
+        # Largest accepted change in penalty points of the current mutation.
+        self.threshold: Optional[float] = None
+
     def update_temperature(self) -> None:
         """Update the temperature based on a cooling scheme.
 
@@ -60,6 +63,45 @@ class SimulatedAnnealing(HillClimber):
         else:
             raise Exception("Type not found or invalid.")
 
+    def draw_threshold(self) -> float:
+        """Draw the change in penalty points a mutation has to stay below to be accepted.
+
+        A mutation is accepted with probability exp(-delta / T), so if u < exp(-delta / T)
+            for a random number u between 0 and 1. This is the same as
+            delta < -T * ln(u). Drawing u before the mutation is evaluated lets the
+            evaluation stop as soon as the change is certain to reach the threshold.
+
+        Returns:
+            float: The threshold, stored until the next call of accept_mutation.
+        """
+        u = random.random()
+        self.threshold = -self.T * math.log(u) if u > 0 else math.inf
+        return self.threshold
+
+    def accept_mutation(self, penalty_delta: int | float) -> bool:
+        """Accept mutations which decrease the penalty score.
+
+        Also sometimes accepts mutations that are worse, depending on the current
+            temperature. Uses the threshold drawn for the mutation, or draws one.
+
+        Args:
+            penalty_delta (int | float): Change in penalty points caused by the mutation.
+
+        Returns:
+            bool: True if the mutation is accepted, else False.
+        """
+        if self.threshold is None:
+            self.draw_threshold()
+        accepted = penalty_delta < self.threshold
+        self.threshold = None
+        if accepted:
+            return True
+
+        # Update the temperature
+        self.update_temperature()
+
+        return False
+
     def check_solution(self, new_model: Model) -> bool:
         """Check and accept better solutions than the current solution.
 
@@ -72,20 +114,10 @@ class SimulatedAnnealing(HillClimber):
         Returns:
             bool: True if new solution has been accepted, else False.
         """
-
-        # Calculate the probability of accepting this new solution
-        delta = new_model - self.best_model
-        probability = math.exp(-delta / self.T)
-
-        # Evaluate against a random number between 0 and 1
-        #   if the new solution is accepted.
-        if random.random() < probability:
+        if self.accept_mutation(new_model - self.best_model):
             self.best_model = new_model
             return True
 
-        # Update the temperature
-        self.update_temperature()
-
         return False
 
     def run(
@@ -7,6 +7,8 @@ class Activity:
     Possible activity categories are lecture, practical or tutorial.
     """
 
+    __slots__ = ("course", "category", "capacity")
+
     def __init__(self, course, category, capacity) -> None:
         """Initialize activity for a course.
 
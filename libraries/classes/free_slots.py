@@ -0,0 +1,140 @@
+from bisect import bisect_right
+from typing import Iterator
+import random
+from libraries.classes.geometry import SlotGeometry
+
+
+class FreeSlots:
+    """The empty indices of a schedule, ordered by hall capacity, day and timeslot.
+
+    Every index has a fixed rank in the slot order of the geometry: descending
+    capacity, then day, timeslot and hall. The indices with a capacity of at
+    least k have the lowest ranks, so they form a prefix of the ranks.
+
+    The empty ranks are counted in a Fenwick tree, which updates and counts the
+    empty ranks in a prefix in O(log n). The largest empty index is the first
+    empty rank, and a random empty index with enough capacity is a random
+    empty rank of the prefix, both found in O(log n) by descending the tree.
+
+    Attributes:
+        geometry (SlotGeometry): Geometry of the schedule.
+    """
+
+    def __init__(self, geometry: SlotGeometry, indices: Iterator[int] = ()) -> None:
+        """Initialise the set of empty indices.
+
+        Args:
+            geometry (SlotGeometry): Geometry of the schedule.
+            indices (Iterator[int]): Indices that are empty. Defaults to none.
+        """
+        self.geometry: SlotGeometry = geometry
+        n_ranks = len(geometry.slot_order)
+
+        # Whether each rank is empty, and the Fenwick tree of their counts.
+        self._empty: list[bool] = [False] * n_ranks
+        for index in indices:
+            self._empty[geometry.slot_rank[index]] = True
+        self._size: int = sum(self._empty)
+        self._tree: list[int] = [0] + [int(empty) for empty in self._empty]
+        for position in range(1, n_ranks + 1):
+            parent = position + (position & -position)
+            if parent <= n_ranks:
+                self._tree[parent] += self._tree[position]
+
+        # Capacities in ascending order of rank, negated to be sorted ascending.
+        self._negated_capacities: tuple[int, ...] = tuple(
+            -capacity for capacity in geometry.ordered_capacities
+        )
+
+    def _update(self, rank: int, change: int) -> None:
+        """Add change to the count of a rank in the Fenwick tree."""
+        position = rank + 1
+        while position < len(self._tree):
+            self._tree[position] += change
+            position += position & -position
+
+    def _select(self, k: int) -> int:
+        """Return the k-th (from 0) empty rank, descending the Fenwick tree."""
+        position = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            next_position = position + step
+            if next_position < len(self._tree) and self._tree[next_position] <= k:
+                position = next_position
+                k -= self._tree[next_position]
+            step >>= 1
+        return position
+
+    def add(self, index: int) -> None:
+        """Mark an index as empty."""
+        rank = self.geometry.slot_rank[index]
+        if not self._empty[rank]:
+            self._empty[rank] = True
+            self._size += 1
+            self._update(rank, 1)
+
+    def discard(self, index: int) -> None:
+        """Mark an index as filled."""
+        rank = self.geometry.slot_rank[index]
+        if self._empty[rank]:
+            self._empty[rank] = False
+            self._size -= 1
+            self._update(rank, -1)
+
+    def count(self, min_capacity: int = 0) -> int:
+        """Return the number of empty indices with a capacity of at least min_capacity."""
+        # Number of ranks, empty or not, with enough capacity.
+        position = bisect_right(self._negated_capacities, -min_capacity)
+        n_indices = 0
+        while position:
+            n_indices += self._tree[position]
+            position -= position & -position
+        return n_indices
+
+    def largest(self) -> int:
+        """Return the empty index with the highest capacity, the earliest one on ties.
+
+        Raises:
+            Exception: There are no empty indices.
+        """
+        if not self._size:
+            raise Exception("There are no empty indices.")
+        return self.geometry.slot_order[self._select(0)]
+
+    def random(self, min_capacity: int = 0) -> int:
+        """Return a random empty index with a capacity of at least min_capacity.
+
+        Args:
+            min_capacity (int): Minimal capacity of the index. Defaults to 0.
+
+        Raises:
+            Exception: There are no empty indices with enough capacity.
+        """
+        n_indices = self.count(min_capacity)
+        if n_indices == 0:
+            raise Exception(f"There are no empty indices with capacity {min_capacity}.")
+        return self.geometry.slot_order[self._select(random.randrange(n_indices))]
+
+    def copy(self) -> "FreeSlots":
+        """Return a copy sharing the geometry."""
+        new_copy = FreeSlots.__new__(FreeSlots)
+        new_copy.geometry = self.geometry
+        new_copy._empty = self._empty.copy()
+        new_copy._size = self._size
+        new_copy._tree = self._tree.copy()
+        new_copy._negated_capacities = self._negated_capacities
+        return new_copy
+
+    def __contains__(self, index: int) -> bool:
+        return self._empty[self.geometry.slot_rank[index]]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the empty indices in slot order."""
+        return (
+            self.geometry.slot_order[rank]
+            for rank, empty in enumerate(self._empty)
+            if empty
+        )
+
+    def __len__(self) -> int:
+        return self._size
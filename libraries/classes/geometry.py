@@ -0,0 +1,169 @@
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+class SlotGeometry:
+    """Lookup tables mapping each schedule index to its day, timeslot and hall.
+
+    Every day consists of a number of regular timeslots, available in every hall,
+    followed by a number of evening timeslots, available only in the evening halls.
+    Indices are numbered by day, then timeslot, then hall. The default geometry has
+    5 days of 4 regular timeslots in every hall and a single evening timeslot in
+    the largest hall. The tables are read-only, so they can be shared by all models.
+
+    Attributes:
+        n_days (int): Number of days in a schedule.
+        n_timeslots (int): Number of timeslots in a day, including evening timeslots.
+        n_evening_timeslots (int): Number of evening timeslots at the end of a day.
+        n_halls (int): Number of halls.
+        evening_halls (tuple[int, ...]): Halls available in evening timeslots.
+        n_slots (int): Number of indices in a schedule.
+        slots_per_day (int): Number of indices in a day.
+        slot_day (np.ndarray): Day of each index.
+        slot_timeslot (np.ndarray): Timeslot of each index.
+        slot_hall (np.ndarray): Hall of each index.
+        slot_capacity (np.ndarray): Hall capacity of each index.
+        slot_is_evening (np.ndarray): Boolean, True if the index is in an evening timeslot.
+        day_lookup (tuple[int, ...]): slot_day as a tuple for scalar lookups.
+        timeslot_lookup (tuple[int, ...]): slot_timeslot as a tuple for scalar lookups.
+        hall_lookup (tuple[int, ...]): slot_hall as a tuple for scalar lookups.
+        capacity_lookup (tuple[int, ...]): slot_capacity as a tuple for scalar lookups.
+        is_evening_lookup (tuple[bool, ...]): slot_is_evening as a tuple for scalar lookups.
+        slot_order (tuple[int, ...]): Indices ordered by descending capacity, then
+            by day, timeslot and hall.
+        slot_rank (tuple[int, ...]): Position of each index in slot_order.
+        ordered_capacities (tuple[int, ...]): Capacity of each index in slot_order,
+            so in descending order.
+        day_names (tuple[str, ...]): Display name of each day.
+        timeslot_names (tuple[str, ...]): Display name of each timeslot.
+    """
+
+    # Daily schedules of students are stored as bitmasks of timeslots, see
+    # DayPenaltyTables, so the penalty tables grow as 2 ** n_timeslots.
+    max_timeslots: int = 16
+
+    def __init__(
+        self,
+        capacities: tuple[int, ...],
+        n_days: int = 5,
+        n_timeslots: int = 5,
+        n_evening_timeslots: int = 1,
+        evening_halls: Optional[tuple[int, ...]] = None,
+    ) -> None:
+        """Compute the lookup tables.
+
+        Args:
+            capacities (tuple[int, ...]): Capacity of each hall, ordered by hall index.
+            n_days (int): Number of days in a schedule. Defaults to 5.
+            n_timeslots (int): Number of timeslots in a day, including evening
+                timeslots. Defaults to 5.
+            n_evening_timeslots (int): Number of evening timeslots at the end of
+                a day. Defaults to 1.
+            evening_halls (tuple[int, ...]): Halls available in evening timeslots.
+                Defaults to None, in which case only the largest hall is available.
+
+        Raises:
+            Exception: The number of days, timeslots or halls is not supported,
+                or an evening hall does not exist.
+        """
+        if len(capacities) == 0 or n_days < 1:
+            raise Exception("A schedule needs at least one hall and one day.")
+        if not 1 <= n_timeslots <= self.max_timeslots:
+            raise Exception(
+                f"The number of timeslots has to be between 1 and {self.max_timeslots}."
+            )
+        if not 0 <= n_evening_timeslots <= n_timeslots:
+            raise Exception("There are more evening timeslots than timeslots.")
+        if evening_halls is None:
+            evening_halls = (int(np.argmax(capacities)),)
+        if any(not 0 <= hall < len(capacities) for hall in evening_halls):
+            raise Exception(f"Evening halls {evening_halls} do not all exist.")
+
+        self.n_days: int = n_days
+        self.n_timeslots: int = n_timeslots
+        self.n_evening_timeslots: int = n_evening_timeslots
+        self.n_halls: int = len(capacities)
+        self.evening_halls: tuple[int, ...] = tuple(evening_halls)
+
+        # Timeslot and hall of each index within a day.
+        first_evening_timeslot = n_timeslots - n_evening_timeslots
+        day_timeslots, day_halls = [], []
+        for timeslot in range(n_timeslots):
+            if timeslot < first_evening_timeslot:
+                halls = range(self.n_halls)
+            else:
+                halls = self.evening_halls
+            day_timeslots += [timeslot] * len(halls)
+            day_halls += list(halls)
+
+        self.slots_per_day: int = len(day_halls)
+        self.n_slots: int = self.slots_per_day * n_days
+
+        slot_timeslot = np.tile(day_timeslots, n_days)
+        self.slot_day: np.ndarray = self._freeze(
+            np.repeat(np.arange(n_days), self.slots_per_day)
+        )
+        self.slot_timeslot: np.ndarray = self._freeze(slot_timeslot)
+        self.slot_hall: np.ndarray = self._freeze(np.tile(day_halls, n_days))
+        self.slot_capacity: np.ndarray = self._freeze(
+            np.array(capacities)[self.slot_hall]
+        )
+        self.slot_is_evening: np.ndarray = self._freeze(
+            slot_timeslot >= first_evening_timeslot
+        )
+
+        self.day_lookup: tuple[int, ...] = tuple(self.slot_day.tolist())
+        self.timeslot_lookup: tuple[int, ...] = tuple(self.slot_timeslot.tolist())
+        self.hall_lookup: tuple[int, ...] = tuple(self.slot_hall.tolist())
+        self.capacity_lookup: tuple[int, ...] = tuple(self.slot_capacity.tolist())
+        self.is_evening_lookup: tuple[bool, ...] = tuple(self.slot_is_evening.tolist())
+
+        # Indices are numbered by day, timeslot and hall, a stable sort keeps that order.
+        slot_order = np.argsort(-self.slot_capacity, kind="stable")
+        slot_rank = np.empty_like(slot_order)
+        slot_rank[slot_order] = np.arange(self.n_slots)
+        self.slot_order: tuple[int, ...] = tuple(slot_order.tolist())
+        self.slot_rank: tuple[int, ...] = tuple(slot_rank.tolist())
+        self.ordered_capacities: tuple[int, ...] = tuple(
+            self.slot_capacity[slot_order].tolist()
+        )
+
+        self.day_names: tuple[str, ...] = tuple(
+            WEEKDAYS[day] if day < len(WEEKDAYS) else f"Day {day + 1}"
+            for day in range(n_days)
+        )
+        # Timeslots of two hours, starting at 9.
+        self.timeslot_names: tuple[str, ...] = tuple(
+            f"{9 + 2 * timeslot}-{11 + 2 * timeslot}" for timeslot in range(n_timeslots)
+        )
+
+    @staticmethod
+    def _freeze(array: np.ndarray) -> np.ndarray:
+        """Mark an array as read-only."""
+        array.setflags(write=False)
+        return array
+
+    def translate_index(self, index: int) -> dict[str, int]:
+        """Return index value as day, timeslot and hall indices."""
+        return {
+            "day": self.day_lookup[index],
+            "timeslot": self.timeslot_lookup[index],
+            "hall": self.hall_lookup[index],
+        }
+
+
+@lru_cache(maxsize=None)
+def get_slot_geometry(
+    capacities: tuple[int, ...],
+    n_days: int = 5,
+    n_timeslots: int = 5,
+    n_evening_timeslots: int = 1,
+    evening_halls: Optional[tuple[int, ...]] = None,
+) -> SlotGeometry:
+    """Return the shared SlotGeometry of a set of hall capacities and layout."""
+    return SlotGeometry(
+        capacities, n_days, n_timeslots, n_evening_timeslots, evening_halls
+    )
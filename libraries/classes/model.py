@@ -2,45 +2,74 @@ from __future__ import annotations
 from libraries.classes.student import Student
 from libraries.classes.course import Course
 from libraries.classes.hall import Hall
-from libraries.helpers.load_data import load_courses, load_students, load_halls
+from libraries.classes.geometry import SlotGeometry
+from libraries.classes.problem_instance import ProblemInstance
+from libraries.classes.penalty_breakdown import PenaltyBreakdown
+from libraries.classes.penalty_tables import DayPenaltyTables, get_day_penalty_tables
+from libraries.classes.score_cache import ScoreCache
+from libraries.classes.score_verifier import ScoreVerifier
+from libraries.classes.free_slots import FreeSlots
 from typing import Optional
-from collections import defaultdict
 import numpy as np
 import copy
+import math
 import random
 
 
 class Model:
     """A model representation for a schedule.
 
-    Contains methods for manipulation of data in schedule indices and manipulation of members of activities.
+    Contains methods for manipulation of data in schedule indices.
+    The static data of the problem (courses, students, halls, enrollments and
+    slot geometry) is stored in a shared read-only ProblemInstance and is
+    available through properties of the same name.
 
     Attributes:
-        courses (dict[str, Course]): A mapping of a course name to a Course object.
-        students (dict[str, Student]):
-            A mapping of a student index (based on loading order) to a Student object.
-        halls (dict[str, Hall]):
-            A mapping of a hall index (based on loading order) to a Hall object.
-        solution (dict[int, tuple[str, str]]): A mapping of a schedule slot index
-            (which maps to day-timeslot-hall) to an activity.
-            An activity is represented as ('Course name', 'Activity').
-            Example of an activity: ('Heuristieken 1', 'lecture 1').
-        activity_enrollments (dict[tuple[str, str], set[int]]):
-            A dictionary containing activities and their set of students.
-            Students are represented by their index number.
-        penalty_per_index (dict[int, int]): Dictionary of penalty points per index.
-            E.G. {'(timeslot) 0': 5 (penalty points)}.
+        instance (ProblemInstance): The static data of the problem, shared by copies.
+        activity_slots (np.ndarray): Index of each activity id in the schedule.
+            Activities which have not been placed contain -1.
+        schedule (np.ndarray): Array of activity ids per schedule slot index
+            (which maps to day-timeslot-hall). Empty slots contain -1.
+        free_slots (FreeSlots): The empty indices of the schedule, ordered by
+            descending capacity, day and timeslot.
+        solution (dict[int, tuple[str, str]]): Read-only mapping of each index
+            to its activity, built from the schedule. Empty indices map to (None, None).
+        penalty_per_index (np.ndarray): Capacity and evening penalty points per index.
+        student_conflict_penalties (np.ndarray): Conflict penalty points per student
+            (rows) and day (columns).
+        student_gap_penalties (np.ndarray): Gap penalty points per student (rows)
+            and day (columns).
         penalties_per_student (dict[int, dict[int, dict[str, int]]]):
-            A mapping of student IDs to a dict of days which map to the conflict penalties and gap penalties.
+            Read-only mapping of student IDs to a dict of days which map to the conflict penalties and gap penalties.
             Example: {(student) 0: {(day) 0: conflict penalties : 5, gap penalties : 2}.
-        unassigned_activities (list[tuple[str, str]]):
-            A list of activities which have not been placed in the solution.
+        unassigned_activities (list[int]): Ids of the activities which have not
+            been placed in the solution. The name of an activity id is stored in
+            activities.
         penalty_points (int | float): Number of penalty points added together.
             Defaults to infinite on an empty model and is overwritten when model is filled.
+        penalty_breakdown (Optional[PenaltyBreakdown]): Cached penalty components of
+            the schedule. None if the schedule changed since it was last scored.
+        zobrist_hash (int): 64-bit hash of the schedule, updated on every change.
+        score_cache (ScoreCache): Memo of penalty breakdowns per schedule hash.
+            Shared by copies of the model and by models made with empty_like.
+        verifier (Optional[ScoreVerifier]): Shadow check of incremental and memoised
+            scores, None if verification is disabled. Shared like score_cache.
+        undo_log (Optional[list[tuple]]): Swaps and overwritten penalties of the open
+            transaction, None if no transaction is open.
+        evening_penalty (int): Penalty points for an activity in an evening slot.
+        student_day_dtype (type): Integer type of the penalties per student and day.
+            The penalties of a single day are small, a compact type keeps copies small.
     """
 
+    evening_penalty: int = 5
+    student_day_dtype: type = np.int16
+
     def __init__(
-        self, path: str = "data", auto_load_students: bool = True
+        self,
+        path: str = "data",
+        auto_load_students: bool = True,
+        instance: Optional[ProblemInstance] = None,
+        score_cache: Optional[ScoreCache] = None,
     ) -> None:
         """Initiatizes a model for a schedule.
 
@@ -48,87 +77,217 @@ class Model:
             path (str): Path for data to load. Defaults to "data".
             auto_load_students (bool): evaluate if  students have to be added to
                 their respective activities in initialisation. Defaults to True.
+            instance (ProblemInstance): Already loaded problem instance to share.
+                Defaults to None, in which case the instance is loaded from path.
+            score_cache (ScoreCache): Memo of penalty breakdowns to share.
+                Defaults to None, in which case a new memo is created.
         """
-        self.courses: dict[str, Course] = load_courses(path)
-        self.students: dict[int, Student] = load_students(self.courses, path)
-        self.halls: dict[int, Hall] = load_halls(path)
-        self.solution = self.init_model((None, None))
-        self.activity_enrollments: dict[
-            tuple[str, str], set[int]
-        ] = self.init_student_model()
-        self.penalty_per_index: dict[int, int] = self.init_model(0)
-        self.penalties_per_student: dict[
-            int, dict[int, dict[str, int]]
-        ] = defaultdict(dict)
-        self.unassigned_activities: list[tuple[str, str]] = list(
-            self.activity_enrollments.keys()
-        )
+        if instance is None:
+            instance = ProblemInstance(path, auto_load_students)
+        self.instance: ProblemInstance = instance
+        self.schedule: np.ndarray = self.init_model(-1)
+        self.free_slots: FreeSlots = FreeSlots(self.geometry, range(len(self.schedule)))
+        self.activity_slots: np.ndarray = np.full(len(self.activities), -1)
+        self.penalty_per_index: np.ndarray = self.init_model(0)
+        self.student_conflict_penalties: np.ndarray = self.init_student_day_penalties()
+        self.student_gap_penalties: np.ndarray = self.init_student_day_penalties()
+        self.unassigned_activities: list[int] = list(range(len(self.activities)))
 
         # Initiate an empty model with an improbably high score to ensure it always evaluates
         #   worse vs. other models. As an empty model contains no data,
         #   it can score no negative points and therefore would compare as better than
         #   a generated model.
         self.penalty_points: int | float = float("inf")
+        self.penalty_breakdown: Optional[PenaltyBreakdown] = None
+        self.undo_log: Optional[list[tuple]] = None
 
-        if auto_load_students is True:
-            # Add members to activities in self.participants.
-            self.add_all_students_to_activities()
+        # The hash of an empty schedule is 0, each placed activity is xor-ed in.
+        self.zobrist_hash: int = 0
+        self.score_cache: ScoreCache = (
+            score_cache if score_cache is not None else ScoreCache()
+        )
+        self.verifier: Optional[ScoreVerifier] = None
 
-    def init_model(
-        self, dict_value: int | tuple[Optional[str], Optional[str]]
-    ) -> dict[int, int | tuple[Optional[str], Optional[str]]]:
-        """Initiate a string representation of a schedule.
+    @classmethod
+    def from_instance(
+        cls, instance: ProblemInstance, score_cache: Optional[ScoreCache] = None
+    ) -> "Model":
+        """Return an empty model of an already loaded problem instance.
 
-        Returns:
-            dict[int : dict(str, str)]:
-                Index (0 - 144) mapping to a dict containing course and activity.
-                Example: {0: {'course': 'Heuristieken', 'activity': 'lecture 1'},
-                {1: {'course': None, 'activity': None}, etc.}
+        Args:
+            instance (ProblemInstance): Problem instance to share.
+            score_cache (ScoreCache): Memo of penalty breakdowns to share.
+                Defaults to None, in which case a new memo is created.
         """
-        schedule_model: dict[int, int | tuple[str, str]] = {
-            index: dict_value for index in range((7 * 4 + 1) * 5)
-        }
+        return cls(instance=instance, score_cache=score_cache)
 
-        return schedule_model
+    def empty_like(self) -> "Model":
+        """Return an empty model sharing the problem instance, score memo and verifier of this model."""
+        new_model = type(self).from_instance(self.instance, self.score_cache)
+        new_model.verifier = self.verifier
+        return new_model
 
-    def translate_index(self, index: int) -> dict[str, int]:
-        """Return index value as day, timeslot and hall indices.
+    def enable_verification(self, rate: float, seed: int = 0) -> None:
+        """Verify a fraction of the incremental and memoised scores of this model.
+
+        A sampled score is compared with a full calculation, and a mismatch raises
+        an exception. Copies of the model made afterwards share the verifier.
+        A rate of 0 disables verification.
 
         Args:
-            index (int): Value 0-144 mapping to a day-hall-timeslot combination.
+            rate (float): Fraction of scores to verify, between 0 and 1.
+            seed (int): Seed of the sampling generator. Defaults to 0.
         """
-        day = index // 29
-        timeslot = (index % 29) // 7
-        if (index % 29) == 28:
-            # Evening slot exception.
-            hall = 5
-        else:
-            # Regular hall indexing.
-            hall = (index % 29) % 7
+        self.verifier = ScoreVerifier(rate, seed) if rate > 0 else None
+
+    @property
+    def courses(self) -> dict[str, Course]:
+        """A mapping of a course name to a Course object."""
+        return self.instance.courses
+
+    @property
+    def students(self) -> dict[int, Student]:
+        """A mapping of a student index (based on loading order) to a Student object."""
+        return self.instance.students
+
+    @property
+    def halls(self) -> dict[int, Hall]:
+        """A mapping of a hall index (based on loading order) to a Hall object."""
+        return self.instance.halls
+
+    @property
+    def geometry(self) -> SlotGeometry:
+        """Lookup tables of the day, timeslot, hall and capacity of each index."""
+        return self.instance.geometry
+
+    @property
+    def slot_day(self) -> np.ndarray:
+        """Day of each schedule slot index."""
+        return self.instance.geometry.slot_day
+
+    @property
+    def slot_timeslot(self) -> np.ndarray:
+        """Timeslot of each schedule slot index."""
+        return self.instance.geometry.slot_timeslot
+
+    @property
+    def slot_hall(self) -> np.ndarray:
+        """Hall of each schedule slot index."""
+        return self.instance.geometry.slot_hall
+
+    @property
+    def slot_capacity(self) -> np.ndarray:
+        """Hall capacity of each schedule slot index."""
+        return self.instance.geometry.slot_capacity
+
+    @property
+    def activities(self) -> list[tuple[str, str]]:
+        """Activities ordered by their activity id.
+
+        An activity is represented as ('Course name', 'Activity').
+        Example of an activity: ('Heuristieken 1', 'lecture 1').
+        """
+        return self.instance.activities
+
+    @property
+    def activity_ids(self) -> dict[tuple[str, str], int]:
+        """A mapping of an activity to its id."""
+        return self.instance.activity_ids
+
+    @property
+    def activity_enrollments(self) -> dict[tuple[str, str], frozenset[int]]:
+        """A mapping of activities to their set of student indices."""
+        return self.instance.activity_enrollments
+
+    @property
+    def activity_students(self) -> tuple[frozenset[int], ...]:
+        """The set of student indices of each activity, indexed by activity id."""
+        return self.instance.activity_students
+
+    @property
+    def activity_sizes(self) -> np.ndarray:
+        """Number of students per activity id, with one trailing zero for empty slots."""
+        return self.instance.activity_sizes
+
+    @property
+    def enrollment_matrix(self) -> np.ndarray:
+        """Boolean student x activity id incidence matrix."""
+        return self.instance.enrollment_matrix
+
+    @property
+    def enrollment_matrix_float32(self) -> np.ndarray:
+        """Student x activity id incidence matrix as float32, for matrix products."""
+        return self.instance.enrollment_matrix_float32
+
+    @property
+    def activity_overlap(self) -> np.ndarray:
+        """Number of students shared by each pair of activity ids."""
+        return self.instance.activity_overlap
+
+    @property
+    def student_activities(self) -> dict[int, tuple[int, ...]]:
+        """A mapping of a student index to the ids of their activities."""
+        return self.instance.student_activities
+
+    def init_model(self, fill_value: int) -> np.ndarray:
+        """Initiate an array representation of a schedule.
 
-        return {"day": day, "timeslot": timeslot, "hall": hall}
+        Args:
+            fill_value (int): Value of each index. An empty slot is -1.
 
-    def init_student_model(self) -> dict[tuple[str, str], set[int]]:
-        """Initiate an activity mapping to a set of students.
+        Returns:
+            np.ndarray: Index (0 - n_slots - 1) mapping to the stored value.
+                Example: [12, -1, 3, ...] where 12 is the id of ('Heuristieken', 'lecture 1').
+        """
+        return np.full(self.geometry.n_slots, fill_value, dtype=int)
 
-        Activities are structured as a tuple('Heuristieken', 'lecture 1').
+    def init_student_day_penalties(self) -> np.ndarray:
+        """Initiate an array of penalty points per student (rows) and day (columns)."""
+        return np.zeros(
+            (len(self.students), self.geometry.n_days), dtype=self.student_day_dtype
+        )
 
-        Returns:
-            dict[tuple[str, str], set[str]]:
-                Activity (as unique tuple of course-activity) and a set of student indices.
+    @property
+    def penalties_per_student(self) -> dict[int, dict[int, dict[str, int]]]:
+        """Return a mapping of each student to the penalties of each day.
+
+        The mapping is a new dict built from the stored penalty arrays.
         """
-        participants: dict[tuple[str, str], set[int]] = {}
-        for course in self.courses.values():
-            for activity in course.activities():
-                participants.update({(course.name, activity.category): set()})
+        self.update_penalty_tables()
+        return {
+            student: {
+                day: {"conflict penalties": conflict, "gap penalties": gap}
+                for day, (conflict, gap) in enumerate(zip(conflicts, gaps))
+            }
+            for student, (conflicts, gaps) in enumerate(
+                zip(
+                    self.student_conflict_penalties.tolist(),
+                    self.student_gap_penalties.tolist(),
+                )
+            )
+        }
+
+    @property
+    def solution(self) -> dict[int, tuple[Optional[str], Optional[str]]]:
+        """Return a mapping of each index to its activity.
+
+        Empty indices map to (None, None). The mapping is a new dict and
+        changes to it do not affect the model.
+        """
+        return {
+            index: self.get_activity_of_index(index)
+            for index in range(len(self.schedule))
+        }
 
-        return participants
+    def translate_index(self, index: int) -> dict[str, int]:
+        """Return index value as day, timeslot and hall indices.
 
-    def add_all_students_to_activities(self) -> None:
-        """Add all students to activities."""
-        for activity_tuple in self.activity_enrollments:
-            for student in self.students:
-                self.add_student_to_activity(int(student), activity_tuple)
+        Kept for compatibility, prefer the lookup tables in self.geometry.
+
+        Args:
+            index (int): Value 0 - n_slots - 1 mapping to a day-hall-timeslot combination.
+        """
+        return self.geometry.translate_index(index)
 
     def get_random_index(
         self, empty: bool = False, weights: Optional[list[int]] = None
@@ -141,9 +300,13 @@ class Model:
             weights (list[int]): Weight to be assigned to each index.
                 Defaults to none, which results in equal weight for each index.
         """
+        if empty is True and weights is None:
+            # Draw directly from the empty indices instead of rejection sampling.
+            return self.free_slots.random()
+
         while True:
             # Acquire index independent of content in index.
-            index = random.choices(list(self.solution.keys()), weights)[0]
+            index = random.choices(range(len(self.schedule)), weights)[0]
             if empty is False:
                 # Return first found index if slot content is irrelevant.
                 return index
@@ -151,25 +314,55 @@ class Model:
                 return index
 
     def get_high_capacity_empty_index(self) -> int:
-        """Return empty index in the schedule with highest capacity."""
-        capacity = 0
-        highest_index = 0
+        """Return empty index in the schedule with highest capacity.
 
-        for index in self.solution:
-            info = self.translate_index(index)
-            temp_capacity = self.halls[info["hall"]].capacity
-            if self.check_index_is_empty(index) and temp_capacity > capacity:
-                capacity = temp_capacity
-                highest_index = index
+        On ties the earliest index is returned, 0 if the schedule is full.
+        """
+        if len(self.free_slots) == 0:
+            return 0
+        return self.free_slots.largest()
 
-        return highest_index
+    def get_random_empty_index_with_capacity(self, min_capacity: int) -> int:
+        """Return a random empty index with a hall capacity of at least min_capacity.
+
+        If there is no such index, the empty index with the highest capacity is returned.
+
+        Args:
+            min_capacity (int): Minimal hall capacity of the index.
+        """
+        if self.free_slots.count(min_capacity) == 0:
+            return self.get_high_capacity_empty_index()
+        return self.free_slots.random(min_capacity)
 
     def check_index_is_empty(self, index: int) -> bool:
         """Return a boolean indicating if index slot contains a course-activity pair."""
-        return self.solution[index][0] is None
+        return bool(self.schedule[index] == -1)
 
     def get_index_penalty_dict(self) -> dict[int, int]:
-        return self.penalty_per_index
+        self.update_penalty_tables()
+        return dict(enumerate(self.penalty_per_index.tolist()))
+
+    def load_schedule(self, schedule: np.ndarray) -> None:
+        """Replace the schedule of the model.
+
+        Args:
+            schedule (np.ndarray): Activity id of each index, -1 for an empty index.
+        """
+        self.schedule = np.array(schedule, dtype=int)
+        self.activity_slots = np.full(len(self.activities), -1)
+        indices = np.flatnonzero(self.schedule != -1)
+        self.activity_slots[self.schedule[indices]] = indices
+        self.free_slots = FreeSlots(
+            self.geometry, np.flatnonzero(self.schedule == -1).tolist()
+        )
+        self.penalty_breakdown = None
+        self.zobrist_hash = self.calc_zobrist_hash()
+
+    def calc_zobrist_hash(self) -> int:
+        """Return the Zobrist hash of the schedule, calculated from scratch."""
+        indices = np.flatnonzero(self.schedule != -1)
+        keys = self.instance.zobrist_key_array[indices, self.schedule[indices]]
+        return int(np.bitwise_xor.reduce(keys, initial=np.uint64(0)))
 
     def swap_activities(self, index_1, index_2) -> None:
         """Swap activities stored at two indices.
@@ -178,26 +371,63 @@ class Model:
             index_1 (int): Index of first activity to be swapped.
             index_2 (int): Index of second activity to be swapped.
         """
-        self.solution[index_1], self.solution[index_2] = (
-            self.solution[index_2],
-            self.solution[index_1],
-        )
+        activity_1 = int(self.schedule[index_1])
+        activity_2 = int(self.schedule[index_2])
+        self.penalty_breakdown = None
+        self.schedule[index_1] = activity_2
+        self.schedule[index_2] = activity_1
+
+        # Keep the activity to index mapping, the empty indices and the hash in sync.
+        if (activity_1 == -1) != (activity_2 == -1):
+            if activity_1 == -1:
+                self.free_slots.discard(index_1)
+                self.free_slots.add(index_2)
+            else:
+                self.free_slots.discard(index_2)
+                self.free_slots.add(index_1)
+        keys = self.instance.zobrist_keys
+        if activity_1 != -1:
+            self.activity_slots[activity_1] = index_2
+            self.zobrist_hash ^= keys[index_1][activity_1] ^ keys[index_2][activity_1]
+        if activity_2 != -1:
+            self.activity_slots[activity_2] = index_1
+            self.zobrist_hash ^= keys[index_2][activity_2] ^ keys[index_1][activity_2]
+
+    def get_activity_id(self, activity: int | tuple[str, str]) -> int:
+        """Return the id of an activity.
+
+        Args:
+            activity (int | tuple[str, str]): Activity id, or the name of the
+                activity as ('course name', 'lecture 1').
+        """
+        if isinstance(activity, tuple):
+            return self.activity_ids[activity]
+        return int(activity)
 
-    def add_activity(self, index: int, activity: tuple[str, str]) -> bool:
+    def add_activity(self, index: int, activity: int | tuple[str, str]) -> bool:
         """Add activity to given index in schedule model.
 
+        Args:
+            index (int): Index in schedule, ranging from 0 - n_slots - 1.
+            activity (int | tuple[str, str]): Activity id or name of the activity.
+
         Returns:
             bool: True if activity was succesfully added, else False.
         """
         if self.check_index_is_empty(index) is True:
-            self.solution[index] = activity
+            activity_id = self.get_activity_id(activity)
+            self.penalty_breakdown = None
+            self.schedule[index] = activity_id
+            self.activity_slots[activity_id] = index
+            self.free_slots.discard(index)
+            self.zobrist_hash ^= self.instance.zobrist_keys[index][activity_id]
             return True
         else:
             return False
 
     def remove_activity(
         self,
-        activity: Optional[tuple[str, str]] = None,
+        activity: Optional[int | tuple[str, str]] = None,
         index: Optional[int] = None,
     ) -> bool:
         """Remove activity from the schedule model.
@@ -209,9 +439,9 @@ class Model:
         If both are given, given activity is compared to stored activity before removal.
 
         Args:
-            activity (tuple[str, str]): course name, activity type.
-                Example: ("Heuristieken", "lecture 1)
-            index (int): Index in schedule, ranging from 0 - 144.
+            activity (int | tuple[str, str]): Activity id, or course name and
+                activity type. Example: ("Heuristieken", "lecture 1)
+            index (int): Index in schedule, ranging from 0 - n_slots - 1.
 
         Returns:
             bool: True if activity was succesfully removed,
@@ -220,11 +450,11 @@ class Model:
         if activity is not None and index is not None:
             # Check if stored activity and index match stored information.
             check_index = self.get_index_of_activity(activity)
-            check_activity = self.get_activity_of_index(index)
+            check_activity = int(self.schedule[index])
 
-            if check_index == index and check_activity == activity:
+            if check_index == index and check_activity == self.get_activity_id(activity):
                 # Remove activity from stored index.
-                self.solution[index] = (None, None)
+                self.clear_index(index)
                 return True
             else:
                 return False
@@ -232,101 +462,82 @@ class Model:
         elif activity is not None:
             # Remove activity from stored index.
             index = self.get_index_of_activity(activity)
-            self.solution[index] = (None, None)
+            if index == -1:
+                # Activity has not been placed in the schedule.
+                return False
+            self.clear_index(index)
             return True
 
         elif index is not None:
             # Remove activity from stored index.
-            self.solution[index] = (None, None)
+            self.clear_index(index)
             return True
 
         return False
 
+    def clear_index(self, index: int) -> None:
+        """Empty an index in the schedule and unmark the index of its activity."""
+        activity_id = int(self.schedule[index])
+        if activity_id != -1:
+            self.activity_slots[activity_id] = -1
+            self.free_slots.add(index)
+            self.penalty_breakdown = None
+            self.zobrist_hash ^= self.instance.zobrist_keys[index][activity_id]
+        self.schedule[index] = -1
+
     def get_hall_capacity(self, index: int) -> int:
         """Return capacity of the hall that is represented by index."""
-        # Translate index into information
-        info = self.translate_index(index)
-        # Get the hall that is described by index
-        hall_index = info["hall"]
-        # Return hall capacity by from list
-        return self.halls[hall_index].capacity
-
-    def get_student_count_in_activity(self, activity: tuple[str, str]) -> int:
-        """Return the capacity of an activity.
-
-        If activity is None, return zero.
-        """
-        # Start with capacity 0
-        capacity = 0
-        # Extract course name and type from activity
-        course_name = activity[0]
-        type = activity[1]
-
-        if course_name and type:
-            # Find the course object the activity belongs to
-            course = self.courses[course_name]
-            # Combine all course activities in one list
-            all_activities = (
-                course.lectures + course.practicals + course.tutorials
-            )
+        return self.geometry.capacity_lookup[index]
 
-            # Iterate over all Activity objects
-            for object in all_activities:
-                # If type matches Activity category
-                if type == object.category:
-                    # Set capacity
-                    capacity = len(
-                        self.activity_enrollments[(course_name, type)]
-                    )
+    def get_student_count_in_activity(self, activity: int | tuple[str, str]) -> int:
+        """Return the number of students enrolled in an activity.
 
-            return int(capacity)
-        else:
-            # If activity is None, return 0
+        If activity is (None, None) or -1, return zero.
+
+        Args:
+            activity (int | tuple[str, str]): Activity id or name of the activity.
+        """
+        if isinstance(activity, tuple) and activity[0] is None:
             return 0
+        # The sizes end with a 0, which is the size of an empty index (-1).
+        return int(self.activity_sizes[self.get_activity_id(activity)])
 
-    def get_index_of_activity(self, activity: tuple[str, str]) -> int:
+    def get_index_of_activity(self, activity: int | tuple[str, str]) -> int:
         """Return index of activity in model.
 
         Args:
-            activity (tuple[str, str]): ('course name', 'lecture 1')
+            activity (int | tuple[str, str]): Activity id or ('course name', 'lecture 1')
+
+        Returns:
+            int: Index of the activity, -1 if the activity has not been placed.
         """
-        return {
-            index
-            for index in self.solution
-            if self.solution[index] == activity
-        }.pop()
+        return int(self.activity_slots[self.get_activity_id(activity)])
 
     def get_activity_of_index(self, index: int) -> tuple[str, str]:
         """Return activity stored at index in model.
 
         Args:
-            index (int): Value ranging from 0 - 144
+            index (int): Value ranging from 0 - n_slots - 1
         """
-        return self.solution[index]
+        activity_id = self.schedule[index]
+        if activity_id == -1:
+            return (None, None)
+        return self.activities[activity_id]
 
     def check_student_in_course(self, student: int, course) -> bool:
         """Return bool if student in specified course."""
-        return True if student in self.courses[course].students else False
+        return self.instance.check_student_in_course(student, course)
 
-    def add_student_to_activity(
-        self, student: int, activity: tuple[str, str]
-    ) -> bool:
-        """Add student to an activity in the model.
+    def get_student_activities(self, student: int) -> list[tuple[str, str]]:
+        """Return the activities a student is enrolled in.
 
         Args:
-            student (int): Index id of a student.
-            activity (tuple[str, str]) : tuple("course name", "lecture 1)
-
-        Returns:
-            bool: True if student not in activity yet, False otherwise.
+            student (int): Index id of the student.
         """
-        if student not in self.activity_enrollments[
-            activity
-        ] and self.check_student_in_course(student, activity[0]):
-            self.activity_enrollments[activity].add(student)
-            return True
-        else:
-            return False
+        return [
+            self.activities[activity_id]
+            for activity_id in self.student_activities[student]
+        ]
 
     def get_student_schedule(self, student: int) -> dict[int, tuple[str, str]]:
         """Return a dict of schedule and activities of the student.
@@ -336,36 +547,39 @@ class Model:
         Args:
             student (int): Index id of the student.
         """
-        activities = [
-            activity
-            for activity, student_list in self.activity_enrollments.items()
-            if student in student_list
-        ]
+        activity_slots = self.activity_slots.tolist()
+        placed_activities = sorted(
+            (activity_slots[activity_id], activity_id)
+            for activity_id in self.student_activities[student]
+            if activity_slots[activity_id] != -1
+        )
         activity_and_indices: dict[int, tuple[str, str]] = {
-            index: activity
-            for index, activity in self.solution.items()
-            if activity in activities
+            index: self.activities[activity_id]
+            for index, activity_id in placed_activities
         }
         return activity_and_indices
 
-    def get_penalties_per_day(self, type="str") -> dict[int, dict[str, int]]:
-        """Return a dictionary of conflict and gap penalty of each day."""
-        penalty_per_day: dict[int, dict[str, int]] = {i: 0 for i in range(5)}
-        for student_penalty in self.penalties_per_student.values():
-            for day, penalties in student_penalty.items():
-                for penalty_type, penalty_value in penalties.items():
-                    if penalty_type == type:
-                        penalty_per_day[day] += penalty_value
+    def get_penalties_per_day(self, type="str") -> dict[int, int]:
+        """Return a dictionary of the conflict or gap penalty of each day.
 
-        return penalty_per_day
+        Args:
+            type (str): "conflict penalties" or "gap penalties".
+        """
+        penalties = {
+            "conflict penalties": self.student_conflict_penalties,
+            "gap penalties": self.student_gap_penalties,
+        }
+        if type not in penalties:
+            return {day: 0 for day in range(self.geometry.n_days)}
+
+        self.update_penalty_tables()
+        return dict(enumerate(penalties[type].sum(axis=0).tolist()))
 
     def get_worst_days(self) -> dict[str, int]:
         """Return the day of highest gap penalties and the day of highest conflict penalties."""
-        gap_per_day = self.get_penalties_per_day("gap penalties")
-        conflict_per_day = self.get_penalties_per_day("conflict penalties")
-
-        worst_gap_day = max(gap_per_day, key=gap_per_day.get)
-        worst_conflict_day = max(conflict_per_day, key=conflict_per_day.get)
+        self.update_penalty_tables()
+        worst_gap_day = int(self.student_gap_penalties.sum(axis=0).argmax())
+        worst_conflict_day = int(self.student_conflict_penalties.sum(axis=0).argmax())
 
         return {"gap day": worst_gap_day, "conflict day": worst_conflict_day}
 
@@ -376,6 +590,7 @@ class Model:
 
         The list of elements is ordered from activities causing most to least penalty points.
         The activities are stored in a dict mapping from their index to the activity.
+        Indices with equal penalties are ordered by index.
 
         Args:
             n (int): length of the list to return.
@@ -385,32 +600,33 @@ class Model:
             dict[int, tuple[str, str]]]: A dictionary of {index: activity}
                 E.g. {0: ('Heuristieken': 'lecture 1')}.
         """
+        self.update_penalty_tables()
 
-        # Update self.index_penalties.
-        self.calc_total_penalty()
+        n = min(n, len(self.penalty_per_index))
+        if n <= 0:
+            return {}
 
-        # Find the highest penalties stored.
-        highest_penalties = {}
-        model = self.penalty_per_index
-        highest_values = sorted(model.values(), reverse=highest)[:n]
+        # Unique keys ordering on penalty first and index second.
+        penalties = -self.penalty_per_index if highest else self.penalty_per_index
+        keys = penalties * len(penalties) + np.arange(len(penalties))
 
-        for high_value in highest_values:
-            for index, value in model.items():
-                if value == high_value:
-                    activity = self.get_activity_of_index(index)
-                    highest_penalties.update({index: activity})
+        # Select the n extremes without sorting all indices, then order them.
+        extremes = np.argpartition(keys, n - 1)[:n]
+        extremes = extremes[np.argsort(keys[extremes])]
 
-        return highest_penalties
+        return {
+            index: self.get_activity_of_index(index) for index in extremes.tolist()
+        }
 
     def calc_capacity_penalty_at_(
-        self, index: int, activity: tuple[str, str]
+        self, index: int, activity: int | tuple[str, str]
     ) -> int:
         """Return the capacity penalty for an activity over capacity.
 
         Args:
             index (int): Index of the activity in the model.
-            activity (tuple[str, str]): Activity to check,
-                an activity is a tuple of ('course name', 'activity').
+            activity (int | tuple[str, str]): Activity to check, an activity id
+                or a tuple of ('course name', 'activity').
 
          Returns:
             int: Penalty points for each student over capacity. 0 if there is no penalty.
@@ -436,15 +652,14 @@ class Model:
         Returns:
             int: The sum of all capacity penalties.
         """
-        penalty_points = 0
-
-        for index, activity in self.solution.items():
-            index_penalty = self.calc_capacity_penalty_at_(index, activity)
-            penalty_points += index_penalty
-            # Add penalty value to dictionary of penalties per index.
-            self.penalty_per_index[index] = index_penalty
+        # Students over capacity per index, empty indices index the trailing zero.
+        index_penalties = np.maximum(
+            self.activity_sizes[self.schedule] - self.slot_capacity, 0
+        )
+        # Store penalty values as penalties per index.
+        self.penalty_per_index[:] = index_penalties
 
-        return penalty_points
+        return int(index_penalties.sum())
 
     def calc_evening_penalties(self) -> int:
         """Penalize activities in evening slots.
@@ -454,19 +669,14 @@ class Model:
         Returns:
             int: The sum of all evening penalties.
         """
-        penalty_points = 0
-        evening_penalty = 5
-
-        for index in self.solution:
-            if self.check_index_is_empty(index) is False:
-                index_info = self.translate_index(index)
-                if index_info["timeslot"] == 4:
-                    # Penalize for being in last timeslot.
-                    penalty_points += evening_penalty
-                    # Add penalty to stored dict of penalties.
-                    self.penalty_per_index[index] += evening_penalty
+        # Penalize filled indices in the evening timeslots.
+        index_penalties = self.evening_penalty * (
+            (self.schedule != -1) & self.geometry.slot_is_evening
+        )
+        # Add penalty to stored penalties per index.
+        self.penalty_per_index += index_penalties
 
-        return penalty_points
+        return int(index_penalties.sum())
 
     def calc_student_course_conflict(self, daily_schedule: list[int]) -> int:
         """Calculate the number of overlapping timeslots for a student.
@@ -474,13 +684,9 @@ class Model:
         Args:
             daily_schedule (list[int]): List of timeslots at which student has activities.
         """
-        return len(
-            [
-                element
-                for element in daily_schedule
-                if daily_schedule.count(element) > 1
-            ]
-        )
+        tables = self.get_day_penalty_tables()
+        occupied, multiple = tables.calc_masks(daily_schedule)
+        return tables.calc_conflict_penalty(len(daily_schedule), occupied, multiple)
 
     def remove_duplicates(self, schedule: list[int]) -> list[int]:
         """Ensure each conflict only counted once.
@@ -498,16 +704,139 @@ class Model:
             daily_schedule (list[int]): List of timeslots in a day at which student has activities.
             third_gap_penalty (int): Penalty if 3 gaps in a daily schedule. Defaults to 5.
         """
-        gap_penalty_map = {0: 0, 1: 1, 2: 3, 3: third_gap_penalty}
-        penalty_schedule = (
-            np.diff(np.sort(self.remove_duplicates(daily_schedule))) - 1
+        tables = self.get_day_penalty_tables(third_gap_penalty)
+        occupied, _ = tables.calc_masks(daily_schedule)
+        return tables.gap_penalty[occupied]
+
+    def calc_daily_schedule_penalties(
+        self, student_schedule: dict[int, list[int]]
+    ) -> dict[int, dict[str, int]]:
+        """Calculate conflict and gap penalties for each day of a student schedule.
+
+        Args:
+            student_schedule (dict[int, list[int]]): Mapping of a day to the
+                timeslots at which the student has activities on that day.
+
+        Returns:
+            dict[int, dict[str, int]]: Mapping of a day to its
+                "conflict penalties" and "gap penalties".
+        """
+        tables = self.get_day_penalty_tables()
+        day_penalties = {}
+        for day, timeslots in student_schedule.items():
+            conflict, gap = tables.calc_day_penalties(timeslots)
+            day_penalties[day] = {"conflict penalties": conflict, "gap penalties": gap}
+        return day_penalties
+
+    def get_day_penalty_tables(self, third_gap_penalty: int = 5) -> DayPenaltyTables:
+        """Return the lookup tables of the penalties of each daily occupancy pattern."""
+        return get_day_penalty_tables(self.geometry.n_timeslots, third_gap_penalty)
+
+    def calc_student_occupancy(self) -> np.ndarray:
+        """Count the activities of each student in each day and timeslot.
+
+        Returns:
+            np.ndarray: Array of shape (students, days, timeslots) containing the
+                number of activities a student has in each timeslot.
+        """
+        return self.calc_schedules_occupancy(self.schedule[np.newaxis])[0]
+
+    def calc_schedules_occupancy(self, schedules: np.ndarray) -> np.ndarray:
+        """Count the activities of each student in each day and timeslot of many schedules.
+
+        Args:
+            schedules (np.ndarray): Array of shape (schedules, indices) containing
+                activity ids, -1 for an empty index.
+
+        Returns:
+            np.ndarray: Array of shape (schedules, students, days, timeslots) containing
+                the number of activities a student has in each timeslot.
+        """
+        n_days = self.geometry.n_days
+        n_timeslots = self.geometry.n_timeslots
+        n_schedules = len(schedules)
+
+        # Map each activity of each schedule to its day-timeslot column.
+        # Empty indices (-1) are counted in a trailing row that is dropped afterwards.
+        activity_slots = np.zeros(
+            (n_schedules, len(self.activities) + 1, n_days * n_timeslots),
+            dtype=np.float32,
         )
+        np.add.at(
+            activity_slots,
+            (
+                np.arange(n_schedules)[:, np.newaxis],
+                schedules,
+                self.slot_day * n_timeslots + self.slot_timeslot,
+            ),
+            1,
+        )
+
+        # Counts are small integers, so float32 matrix products are exact.
+        occupancy = self.enrollment_matrix_float32 @ activity_slots[:, :-1]
+        return occupancy.astype(np.int32).reshape(
+            n_schedules, len(self.students), n_days, n_timeslots
+        )
+
+    def calc_student_day_penalties(
+        self, occupancy: np.ndarray, third_gap_penalty: int = 5
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate conflict and gap penalties from activity counts per timeslot.
+
+        Matches calc_student_course_conflict and calc_student_gap_penalty
+        for every day in the occupancy array.
+
+        Args:
+            occupancy (np.ndarray): Number of activities per timeslot, the last
+                axis being the timeslots of a single day.
+            third_gap_penalty (int): Penalty if 3 gaps in a daily schedule. Defaults to 5.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Conflict penalties and gap penalties with
+                the shape of occupancy without its last axis.
+        """
+        tables = self.get_day_penalty_tables(third_gap_penalty)
+
+        # Encode each day as a mask of occupied and multiple occupied timeslots.
+        bits = 1 << np.arange(occupancy.shape[-1])
+        occupied = ((occupancy > 0) * bits).sum(axis=-1)
+        multiple = ((occupancy > 1) * bits).sum(axis=-1)
 
-        return gap_penalty_map[sum(penalty_schedule)]
+        conflicts = (
+            occupancy.sum(axis=-1)
+            - tables.popcount_array[occupied]
+            + tables.popcount_array[multiple]
+        )
+        return conflicts, tables.gap_penalty_array[occupied]
 
     def calc_student_schedule_penalties(self) -> dict[str, int]:
         """Calculate gap and conflict penalties of each schedule of each student.
 
+        All students are evaluated at once through the enrollment matrix.
+
+        Returns:
+            dict[str, int]: Key: "conflict penalties", "gap penalties".
+                Value: Sum of each penalty.
+
+        """
+        occupancy = self.calc_student_occupancy()
+        conflicts, gaps = self.calc_student_day_penalties(occupancy)
+
+        # Store the penalties of every student on every day.
+        self.student_conflict_penalties = conflicts.astype(self.student_day_dtype)
+        self.student_gap_penalties = gaps.astype(self.student_day_dtype)
+
+        return {
+            "conflict penalties": int(conflicts.sum()),
+            "gap penalties": int(gaps.sum()),
+        }
+
+    def calc_student_schedule_penalties_per_student(self) -> dict[str, int]:
+        """Calculate gap and conflict penalties of each schedule of each student.
+
+        Evaluates one student at a time. Serves as a reference for the
+        batched calculation of calc_student_schedule_penalties.
+
         Returns:
             dict[str, int]: Key: "conflict penalties", "gap penalties".
                 Value: Sum of each penalty.
@@ -516,37 +845,29 @@ class Model:
         total_gap_penalties = 0
         total_course_conflicts_penalties = 0
 
+        slot_days = self.geometry.day_lookup
+        slot_timeslots = self.geometry.timeslot_lookup
+
         for id in self.students:
             activities = self.get_student_schedule(id)
 
             student_schedule: dict[int, list[int]] = {}
 
-            for activity in activities:
-                index_info = self.translate_index(activity)
-                student_schedule.setdefault(index_info["day"], []).append(
-                    index_info["timeslot"]
+            for index in activities:
+                student_schedule.setdefault(slot_days[index], []).append(
+                    slot_timeslots[index]
                 )
 
-            for day in student_schedule:
-                course_conflict_points = self.calc_student_course_conflict(
-                    student_schedule[day]
-                )
-                gap_penalty_points = self.calc_student_gap_penalty(
-                    student_schedule[day]
-                )
-                total_course_conflicts_penalties += course_conflict_points
-                total_gap_penalties += gap_penalty_points
-
-                self.penalties_per_student.update(
-                    {
-                        id: {
-                            day: {
-                                "conflict penalties": course_conflict_points,
-                                "gap penalties": gap_penalty_points,
-                            }
-                        }
-                    }
-                )
+            day_penalties = self.calc_daily_schedule_penalties(student_schedule)
+
+            # Store the penalties of every day of the student.
+            self.student_conflict_penalties[id] = 0
+            self.student_gap_penalties[id] = 0
+            for day, penalties in day_penalties.items():
+                total_course_conflicts_penalties += penalties["conflict penalties"]
+                total_gap_penalties += penalties["gap penalties"]
+                self.student_conflict_penalties[id, day] = penalties["conflict penalties"]
+                self.student_gap_penalties[id, day] = penalties["gap penalties"]
 
         return {
             "conflict penalties": total_course_conflicts_penalties,
@@ -565,23 +886,434 @@ class Model:
     def calc_total_penalty(self) -> int:
         """Calculate the total penalty of the schedule.
 
-        Also updates stored value of penalty_points.
+        Also updates stored value of penalty_points and penalty_breakdown.
 
         Returns:
             int: Sum of all penalties.
         """
-        total = (
-            self.calc_total_capacity_penalties()
-            + self.calc_evening_penalties()
-            + self.sum_student_schedule_penalties()
+        capacity_penalties = self.calc_total_capacity_penalties()
+        evening_penalties = self.calc_evening_penalties()
+        student_penalties = self.calc_student_schedule_penalties()
+
+        self.penalty_breakdown = PenaltyBreakdown(
+            capacity=capacity_penalties,
+            evening=evening_penalties,
+            conflict=student_penalties["conflict penalties"],
+            gap=student_penalties["gap penalties"],
+        )
+        self.penalty_points = self.penalty_breakdown.total
+        self.score_cache.put(self.zobrist_hash, self.penalty_breakdown)
+
+        return self.penalty_points
+
+    def calc_penalty_breakdowns(
+        self, schedules: np.ndarray, batch_size: int = 256
+    ) -> list[PenaltyBreakdown]:
+        """Calculate the penalty components of many schedules at once.
+
+        The schedules are scored against the problem instance of this model,
+        the model itself is left unchanged.
+
+        Args:
+            schedules (np.ndarray): Array of shape (schedules, indices) containing
+                activity ids, -1 for an empty index.
+            batch_size (int): Number of schedules scored per vectorised step,
+                limits memory use. Defaults to 256.
+
+        Returns:
+            list[PenaltyBreakdown]: Penalty components of each schedule, in order.
+        """
+        schedules = np.asarray(schedules).reshape(-1, self.geometry.n_slots)
+
+        capacity = np.maximum(
+            self.activity_sizes[schedules] - self.slot_capacity, 0
+        ).sum(axis=1)
+        evening = self.evening_penalty * (
+            (schedules != -1) & self.geometry.slot_is_evening
+        ).sum(axis=1)
+
+        conflict = np.zeros(len(schedules), dtype=int)
+        gap = np.zeros(len(schedules), dtype=int)
+        for start in range(0, len(schedules), batch_size):
+            batch = slice(start, start + batch_size)
+            conflicts, gaps = self.calc_student_day_penalties(
+                self.calc_schedules_occupancy(schedules[batch])
+            )
+            conflict[batch] = conflicts.sum(axis=(1, 2))
+            gap[batch] = gaps.sum(axis=(1, 2))
+
+        return [
+            PenaltyBreakdown(*components)
+            for components in zip(
+                capacity.tolist(), evening.tolist(), conflict.tolist(), gap.tolist()
+            )
+        ]
+
+    def get_penalty_breakdown(self) -> PenaltyBreakdown:
+        """Return the penalty components of the schedule.
+
+        The breakdown is cached and only recalculated if the schedule changed.
+        A schedule that was scored before is looked up in the score memo, in which
+        case the penalties per index and per student are not recalculated.
+        """
+        if self.penalty_breakdown is not None:
+            return self.penalty_breakdown
+
+        breakdown = self.score_cache.get(self.zobrist_hash)
+        if breakdown is None:
+            self.calc_total_penalty()
+            return self.penalty_breakdown
+
+        self.penalty_points = breakdown.total
+        if self.verifier is not None:
+            self.verifier.sample(
+                self, breakdown, f"score cache hit of schedule hash {self.zobrist_hash:#x}"
+            )
+        return breakdown
+
+    @property
+    def penalty_tables_valid(self) -> bool:
+        """Return whether the stored penalties per index and per student match the schedule.
+
+        The tables are updated together with penalty_breakdown, by calc_total_penalty,
+        apply_swaps and rollback. Every change of the schedule clears penalty_breakdown,
+        and a score memo hit only restores penalty_points, so the tables are valid
+        exactly when penalty_breakdown is set.
+        """
+        return self.penalty_breakdown is not None
+
+    def update_penalty_tables(self) -> None:
+        """Recalculate the stored penalties per index and per student if they are stale."""
+        if not self.penalty_tables_valid:
+            self.calc_total_penalty()
+
+    def get_penalty_points(self) -> int:
+        """Return the total penalty of the schedule, from the score memo if possible.
+
+        Also updates stored value of penalty_points.
+        Use calc_total_penalty if the penalties per index and per student are needed.
+        """
+        return self.get_penalty_breakdown().total
+
+    def calc_slot_penalties(self, index: int) -> tuple[int, int]:
+        """Return the capacity penalty and evening penalty of a single index."""
+        activity_id = self.schedule[index]
+        if activity_id == -1:
+            return 0, 0
+        capacity_penalty = max(
+            int(self.activity_sizes[activity_id]) - self.geometry.capacity_lookup[index],
+            0,
+        )
+        if self.geometry.is_evening_lookup[index]:
+            return capacity_penalty, self.evening_penalty
+        return capacity_penalty, 0
+
+    def calc_slot_penalty(self, index: int) -> int:
+        """Return the capacity and evening penalty of a single index."""
+        return sum(self.calc_slot_penalties(index))
+
+    def get_swap_scope(
+        self, swaps: list[tuple[int, int]]
+    ) -> tuple[set[int], set[int], set[int]]:
+        """Return the indices, students and days affected by a series of swaps.
+
+        Swaps only permute activities between the touched indices, so the
+        students enrolled in those activities are the only students whose
+        schedule changes, and only on the days of the touched indices.
+
+        Args:
+            swaps (list[tuple[int, int]]): Pairs of indices to be swapped.
+
+        Returns:
+            tuple[set[int], set[int], set[int]]: Touched indices, affected students
+                and affected days.
+        """
+        indices = {index for swap in swaps for index in swap}
+        students: set[int] = set()
+        for index in indices:
+            activity_id = self.schedule[index]
+            if activity_id != -1:
+                students |= self.activity_students[activity_id]
+        days = {self.geometry.day_lookup[index] for index in indices}
+
+        return indices, students, days
+
+    def calc_partial_student_penalties(
+        self, students: list[int], days: list[int], max_total: float = math.inf
+    ) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """Calculate the conflict and gap penalties of a subset of students and days.
+
+        Args:
+            students (list[int]): Index ids of the students to evaluate.
+            days (list[int]): Days to evaluate.
+            max_total (float): Stop as soon as the sum of the penalties of the
+                evaluated students reaches this value. Defaults to infinite.
+
+        Returns:
+            Optional[tuple[np.ndarray, np.ndarray]]: Conflict penalties and gap
+                penalties with a row per student and a column per day, in the given
+                order. None if the calculation stopped at max_total.
+        """
+        tables = self.get_day_penalty_tables()
+        slot_days = self.geometry.day_lookup
+        slot_timeslots = self.geometry.timeslot_lookup
+        activity_slots = self.activity_slots.tolist()
+        day_columns = {day: column for column, day in enumerate(days)}
+
+        # Penalties are never negative, so a max_total of 0 is reached without
+        # evaluating any student, also if there are no students at all.
+        if max_total <= 0:
+            return None
+
+        conflicts = [0] * (len(students) * len(days))
+        gaps = [0] * (len(students) * len(days))
+        total = 0
+        for row, student in enumerate(students):
+            schedule: dict[int, list[int]] = {}
+            for activity_id in self.student_activities[student]:
+                index = activity_slots[activity_id]
+                if index == -1 or slot_days[index] not in day_columns:
+                    continue
+                schedule.setdefault(day_columns[slot_days[index]], []).append(
+                    slot_timeslots[index]
+                )
+            for column, timeslots in schedule.items():
+                position = row * len(days) + column
+                conflict, gap = tables.calc_day_penalties(timeslots)
+                conflicts[position], gaps[position] = conflict, gap
+                total += conflict + gap
+            if total >= max_total:
+                return None
+
+        shape = (len(students), len(days))
+        return (
+            np.array(conflicts, dtype=int).reshape(shape),
+            np.array(gaps, dtype=int).reshape(shape),
+        )
+
+    def sum_partial_penalties(
+        self, indices: set[int], conflicts: np.ndarray, gaps: np.ndarray
+    ) -> PenaltyBreakdown:
+        """Return the penalty components of a subset of indices and students."""
+        capacity = evening = 0
+        for index in indices:
+            capacity_penalty, evening_penalty = self.calc_slot_penalties(index)
+            capacity += capacity_penalty
+            evening += evening_penalty
+        return PenaltyBreakdown(capacity, evening, int(conflicts.sum()), int(gaps.sum()))
+
+    def calc_swaps_delta(self, swaps: list[tuple[int, int]]) -> int:
+        """Return the change in penalty points if a series of swaps were applied.
+
+        Only the touched indices and the students enrolled in the swapped
+        activities on the touched days are evaluated. The model is left unchanged.
+
+        Args:
+            swaps (list[tuple[int, int]]): Pairs of indices to be swapped in order.
+
+        Returns:
+            int: Penalty points after the swaps minus penalty points before the swaps.
+        """
+        indices, students, days = self.get_swap_scope(swaps)
+        students, days = list(students), list(days)
+        before = self.sum_partial_penalties(
+            indices, *self.calc_partial_student_penalties(students, days)
+        )
+
+        breakdown = self.penalty_breakdown
+        for index_1, index_2 in swaps:
+            self.swap_activities(index_1, index_2)
+        after = self.sum_partial_penalties(
+            indices, *self.calc_partial_student_penalties(students, days)
+        )
+        self.revert_swaps(swaps, breakdown)
+
+        return (after - before).total
+
+    def revert_swaps(
+        self,
+        swaps: list[tuple[int, int]],
+        penalty_breakdown: Optional[PenaltyBreakdown],
+    ) -> None:
+        """Undo a series of swaps and restore the penalty breakdown from before them.
+
+        Args:
+            swaps (list[tuple[int, int]]): Pairs of indices that were swapped in order.
+            penalty_breakdown (Optional[PenaltyBreakdown]): Breakdown before the swaps.
+        """
+        for index_1, index_2 in reversed(swaps):
+            self.swap_activities(index_1, index_2)
+        # Swapping back restores the schedule, so the cache is still valid.
+        self.penalty_breakdown = penalty_breakdown
+
+    def calc_swap_delta(self, index_1: int, index_2: int) -> int:
+        """Return the change in penalty points if two indices were swapped."""
+        return self.calc_swaps_delta([(index_1, index_2)])
+
+    def apply_swaps(
+        self, swaps: list[tuple[int, int]], max_delta: float = math.inf
+    ) -> Optional[int]:
+        """Swap activities and update the stored penalties incrementally.
+
+        Falls back on a full calculation if the model has not been scored since
+        its schedule last changed.
+
+        With a max_delta, the swaps are undone as soon as the change in penalty
+        points is certain to reach it. Penalties are never negative, so the change
+        is at least the change in capacity and evening penalties, plus the new
+        penalties of the students evaluated so far, minus the old penalties of
+        all affected students. Callers that reject such swaps anyway only pay for
+        part of the evaluation.
+
+        The new schedule is looked up in the score memo first. On a hit, swaps
+        that reach max_delta are undone without evaluating any student, and
+        otherwise the memoised breakdown is used while the stored penalties
+        per index and per student are still updated.
+
+        Args:
+            swaps (list[tuple[int, int]]): Pairs of indices to be swapped in order.
+            max_delta (float): Change in penalty points at which the swaps are
+                undone. Defaults to infinite, ignored by the full calculation.
+
+        Returns:
+            Optional[int]: Total penalty of the model after the swaps, None if the
+                swaps were undone because the change reached max_delta.
+        """
+        if not self.penalty_tables_valid:
+            if self.undo_log is not None:
+                self.undo_log.append(
+                    (
+                        swaps,
+                        self.penalty_points,
+                        self.penalty_breakdown,
+                        dict(enumerate(self.penalty_per_index.tolist())),
+                        (slice(None), slice(None)),
+                        self.student_conflict_penalties.copy(),
+                        self.student_gap_penalties.copy(),
+                    )
+                )
+            for index_1, index_2 in swaps:
+                self.swap_activities(index_1, index_2)
+            return self.calc_total_penalty()
+
+        indices, students, days = self.get_swap_scope(swaps)
+        students, days = list(students), list(days)
+        # Student day penalties are up to date, so only read the current values.
+        block = np.ix_(np.array(students, dtype=int), np.array(days, dtype=int))
+        before = self.sum_partial_penalties(
+            indices,
+            self.student_conflict_penalties[block],
+            self.student_gap_penalties[block],
         )
 
-        self.penalty_points = total
+        breakdown = self.penalty_breakdown
+        for index_1, index_2 in swaps:
+            self.swap_activities(index_1, index_2)
+
+        # A schedule that was scored before is judged on its memoised breakdown.
+        cached = self.score_cache.get(self.zobrist_hash)
+        max_student_penalty = math.inf
+        if cached is None and max_delta != math.inf:
+            slot_penalty = sum(self.calc_slot_penalty(index) for index in indices)
+            max_student_penalty = max_delta + before.total - slot_penalty
+        if cached is not None and cached.total - breakdown.total >= max_delta:
+            student_penalties = None
+        else:
+            student_penalties = self.calc_partial_student_penalties(
+                students, days, max_student_penalty
+            )
+        if student_penalties is None:
+            self.revert_swaps(swaps, breakdown)
+            return None
+
+        conflicts, gaps = student_penalties
+        after = self.sum_partial_penalties(indices, conflicts, gaps)
+
+        if self.undo_log is not None:
+            # Store everything that is about to be overwritten.
+            self.undo_log.append(
+                (
+                    swaps,
+                    self.penalty_points,
+                    breakdown,
+                    {index: self.penalty_per_index[index] for index in indices},
+                    block,
+                    self.student_conflict_penalties[block],
+                    self.student_gap_penalties[block],
+                )
+            )
+
+        for index in indices:
+            self.penalty_per_index[index] = self.calc_slot_penalty(index)
+        self.student_conflict_penalties[block] = conflicts
+        self.student_gap_penalties[block] = gaps
+
+        if cached is None:
+            self.penalty_breakdown = breakdown + (after - before)
+            self.score_cache.put(self.zobrist_hash, self.penalty_breakdown)
+        else:
+            # The penalty tables are updated above either way, so they stay in sync.
+            self.penalty_breakdown = cached
+        self.penalty_points = self.penalty_breakdown.total
+        if self.verifier is not None:
+            self.verifier.sample(self, self.penalty_breakdown, f"swaps {swaps}")
+
+        return self.penalty_points
+
+    def begin(self) -> None:
+        """Open a transaction.
+
+        Swaps applied through apply_swaps are logged until the transaction is
+        closed with commit or undone with rollback.
+
+        Raises:
+            Exception: A transaction is already open.
+        """
+        if self.undo_log is not None:
+            raise Exception("Transaction already in progress.")
+        self.undo_log = []
+
+    def commit(self) -> None:
+        """Keep all swaps of the open transaction and close it."""
+        self.undo_log = None
 
-        return total
+    def rollback(self) -> None:
+        """Undo all swaps of the open transaction and restore stored penalties.
+
+        Raises:
+            Exception: No transaction is open.
+        """
+        if self.undo_log is None:
+            raise Exception("No transaction in progress.")
+
+        for (
+            swaps,
+            penalty_points,
+            penalty_breakdown,
+            index_penalties,
+            block,
+            conflicts,
+            gaps,
+        ) in reversed(self.undo_log):
+            for index_1, index_2 in reversed(swaps):
+                self.swap_activities(index_1, index_2)
+            for index, penalty in index_penalties.items():
+                self.penalty_per_index[index] = penalty
+            self.student_conflict_penalties[block] = conflicts
+            self.student_gap_penalties[block] = gaps
+            self.penalty_points = penalty_points
+            self.penalty_breakdown = penalty_breakdown
+
+        if self.verifier is not None and self.penalty_breakdown is not None:
+            swaps = [swap for entry in self.undo_log for swap in entry[0]]
+            self.verifier.sample(
+                self, self.penalty_breakdown, f"rollback of swaps {swaps}"
+            )
+        self.undo_log = None
 
     def get_penalty_at_index(self, index: int) -> int:
         """ "Returns the stored penalty at a given index."""
+        self.update_penalty_tables()
         return self.penalty_per_index[index]
 
     def sort_activities_on_enrollments(self, descending: bool = True) -> None:
@@ -593,35 +1325,34 @@ class Model:
 
         Sorting occurs inplace in self.unassgined_activities.
         """
+        sizes = self.activity_sizes.tolist()
         self.unassigned_activities = sorted(
-            self.activity_enrollments,
-            key=lambda key: len(self.activity_enrollments[key]),
+            range(len(self.activities)),
+            key=lambda activity_id: sizes[activity_id],
             reverse=descending,
         )
 
     def calc_activity_overlap(
         self,
-        activity1: tuple[str, str],
-        activity2: tuple[str, str],
+        activity1: int | tuple[str, str],
+        activity2: int | tuple[str, str],
         student_overlap_value: bool = True,
     ) -> int:
         """ "Calculate the number of overlapping students or activities.
 
         Args:
-            activity1 (tuple[str, str]): 'Course Name', 'Activity'.
-            activity2 (tuple[str, str]): Same as activity1. E.G. ('Heuristieken', 'lecture 1')
+            activity1 (int | tuple[str, str]): Activity id or ('Course Name', 'Activity').
+            activity2 (int | tuple[str, str]): Same as activity1. E.G. ('Heuristieken', 'lecture 1')
             student_overlap_value (bool): Evaluate type of value to be returned. Defaults to true.
                 On true will return the number of students enrolled in both activity1 and activity2.
                 Otherwise will return binary 1 if there is overlap, 0 if there is not.
         """
-        overlap = len(
-            self.activity_enrollments[activity1].intersection(
-                self.activity_enrollments[activity2]
-            )
-        )
+        overlap = self.activity_overlap[
+            self.get_activity_id(activity1), self.get_activity_id(activity2)
+        ]
         if student_overlap_value is True:
             # Return number of overlapping students.
-            return overlap
+            return int(overlap)
         elif overlap != 0:
             # Return overlap of activity.
             return 1
@@ -639,20 +1370,19 @@ class Model:
             student_overlap_value (bool): Sorts by number of overlapping students if True.
                 Defaults to true. If False, only counts overlapping activities.
         """
-        overlap_count = dict.fromkeys(
-            (activity for activity in self.activity_enrollments), 0
-        )
+        overlap = self.activity_overlap
+        if student_overlap_value is False:
+            overlap = overlap != 0
 
-        for activity1 in self.activity_enrollments:
-            for activity2 in self.activity_enrollments:
-                if activity1[0] != activity2[0]:
-                    # Ensure activities from different courses.
-                    overlap_count[activity1] += self.calc_activity_overlap(
-                        activity1, activity2, student_overlap_value
-                    )
+        # Only count overlap with activities from different courses.
+        overlap_count = (
+            (overlap * self.instance.activity_course_differs).sum(axis=1).tolist()
+        )
 
         self.unassigned_activities = sorted(
-            overlap_count, key=lambda act: overlap_count[act], reverse=True
+            range(len(self.activities)),
+            key=lambda activity_id: overlap_count[activity_id],
+            reverse=True,
         )
 
     def shuffle_activities(self) -> None:
@@ -662,18 +1392,27 @@ class Model:
         )
 
     def copy(self) -> "Model":
-        """Return a copy of the model."""
+        """Return a copy of the model.
+
+        The problem instance and score memo are shared, only the schedule and
+        penalties are copied.
+        """
         new_copy = copy.copy(self)
-        new_copy.solution = copy.copy(self.solution)
-        new_copy.activity_enrollments = copy.deepcopy(
-            self.activity_enrollments
-        )
-        new_copy.unassigned_activities = [
-            copy.deepcopy(tuple) for tuple in self.unassigned_activities
-        ]
+        new_copy.schedule = self.schedule.copy()
+        new_copy.activity_slots = self.activity_slots.copy()
+        new_copy.free_slots = self.free_slots.copy()
+        new_copy.penalty_per_index = self.penalty_per_index.copy()
+        new_copy.student_conflict_penalties = self.student_conflict_penalties.copy()
+        new_copy.student_gap_penalties = self.student_gap_penalties.copy()
+        new_copy.undo_log = None
+        new_copy.unassigned_activities = copy.copy(self.unassigned_activities)
 
         return new_copy
 
+    def has_same_schedule(self, other: "Model") -> bool:
+        """Return a boolean indicating if both models store the same schedule."""
+        return np.array_equal(self.schedule, other.schedule)
+
     def check_valid_schedule_of_student(self, student: int) -> bool:
         """Evaluate if all activities of a student have been assigned to an index in the model.
 
@@ -705,9 +1444,7 @@ class Model:
         for course in self.courses.values():
             n_activities += len(course.activities())
 
-        activity_set = set()
-        for activity in self.solution.values():
-            activity_set.add(activity)
+        activity_set = set(self.schedule[self.schedule != -1].tolist())
 
         if n_activities <= len(activity_set):
             return True
@@ -0,0 +1,42 @@
+from typing import NamedTuple
+
+
+class PenaltyBreakdown(NamedTuple):
+    """The penalty points of a schedule split into their components.
+
+    Breakdowns of parts of a schedule can be added and subtracted component-wise.
+
+    Attributes:
+        capacity (int): Penalty points for students over hall capacity.
+        evening (int): Penalty points for activities in evening slots.
+        conflict (int): Penalty points for overlapping activities of students.
+        gap (int): Penalty points for gaps in the daily schedules of students.
+    """
+
+    capacity: int = 0
+    evening: int = 0
+    conflict: int = 0
+    gap: int = 0
+
+    @property
+    def total(self) -> int:
+        """Return the sum of all penalty components."""
+        return self.capacity + self.evening + self.conflict + self.gap
+
+    def student_penalties(self) -> dict[str, int]:
+        """Return the student penalties in the format of calc_student_schedule_penalties."""
+        return {"conflict penalties": self.conflict, "gap penalties": self.gap}
+
+    def __add__(self, other: object) -> "PenaltyBreakdown":
+        if isinstance(other, PenaltyBreakdown):
+            return PenaltyBreakdown(*(a + b for a, b in zip(self, other)))
+        raise TypeError(
+            f"Addition not possible between PenaltyBreakdown and {type(other)}."
+        )
+
+    def __sub__(self, other: object) -> "PenaltyBreakdown":
+        if isinstance(other, PenaltyBreakdown):
+            return PenaltyBreakdown(*(a - b for a, b in zip(self, other)))
+        raise TypeError(
+            f"Subtraction not possible between PenaltyBreakdown and {type(other)}."
+        )
@@ -0,0 +1,97 @@
+from functools import lru_cache
+import numpy as np
+
+
+class DayPenaltyTables:
+    """Lookup tables of the penalties of every occupancy pattern of a single day.
+
+    The timeslots of a day at which a student has activities are stored as a
+    bitmask, bit t being set if the student has at least one activity in timeslot t.
+    A second bitmask marks the timeslots with more than one activity. The gap and
+    conflict penalties of a day follow from these masks and the number of activities.
+
+    Attributes:
+        n_timeslots (int): Number of timeslots in a day.
+        third_gap_penalty (int): Penalty if 3 gaps in a daily schedule.
+        popcount (tuple[int, ...]): Number of set bits of each mask.
+        gap_penalty (tuple[int, ...]): Gap penalty of each occupied mask.
+            Gaps beyond the third are penalised as the third.
+        popcount_array (np.ndarray): popcount as an array for vectorised lookups.
+        gap_penalty_array (np.ndarray): gap_penalty as an array for vectorised lookups.
+    """
+
+    def __init__(self, n_timeslots: int, third_gap_penalty: int = 5) -> None:
+        """Compute the lookup tables.
+
+        Args:
+            n_timeslots (int): Number of timeslots in a day.
+            third_gap_penalty (int): Penalty if 3 gaps in a daily schedule. Defaults to 5.
+        """
+        self.n_timeslots: int = n_timeslots
+        self.third_gap_penalty: int = third_gap_penalty
+
+        masks = np.arange(2**n_timeslots)
+        occupied = (masks[:, np.newaxis] >> np.arange(n_timeslots)) & 1 == 1
+        n_occupied = occupied.sum(axis=1)
+        first = occupied.argmax(axis=1)
+        last = n_timeslots - 1 - occupied[:, ::-1].argmax(axis=1)
+        gaps = np.where(n_occupied > 0, last - first + 1 - n_occupied, 0)
+
+        gap_penalty_map = np.array([0, 1, 3, third_gap_penalty])
+        gap_penalty = gap_penalty_map[np.minimum(gaps, len(gap_penalty_map) - 1)]
+
+        self.popcount_array: np.ndarray = n_occupied
+        self.gap_penalty_array: np.ndarray = gap_penalty
+        self.popcount_array.setflags(write=False)
+        self.gap_penalty_array.setflags(write=False)
+        self.popcount: tuple[int, ...] = tuple(n_occupied.tolist())
+        self.gap_penalty: tuple[int, ...] = tuple(gap_penalty.tolist())
+
+    def calc_masks(self, timeslots: list[int]) -> tuple[int, int]:
+        """Return the occupied mask and the multiple occupied mask of a day.
+
+        Args:
+            timeslots (list[int]): Timeslots at which a student has activities.
+        """
+        occupied = multiple = 0
+        for timeslot in timeslots:
+            bit = 1 << timeslot
+            multiple |= occupied & bit
+            occupied |= bit
+        return occupied, multiple
+
+    def calc_conflict_penalty(
+        self, n_activities: int, occupied: int, multiple: int
+    ) -> int:
+        """Return the conflict penalty of a day.
+
+        Every activity in a timeslot with more than one activity counts as a conflict.
+        This equals all activities, minus one per occupied timeslot, plus one per
+        timeslot with more than one activity.
+
+        Args:
+            n_activities (int): Number of activities in the day.
+            occupied (int): Mask of the timeslots with activities.
+            multiple (int): Mask of the timeslots with more than one activity.
+        """
+        return n_activities - self.popcount[occupied] + self.popcount[multiple]
+
+    def calc_day_penalties(self, timeslots: list[int]) -> tuple[int, int]:
+        """Return the conflict and gap penalty of a day.
+
+        Args:
+            timeslots (list[int]): Timeslots at which a student has activities.
+        """
+        occupied, multiple = self.calc_masks(timeslots)
+        return (
+            self.calc_conflict_penalty(len(timeslots), occupied, multiple),
+            self.gap_penalty[occupied],
+        )
+
+
+@lru_cache(maxsize=None)
+def get_day_penalty_tables(
+    n_timeslots: int, third_gap_penalty: int = 5
+) -> DayPenaltyTables:
+    """Return the shared DayPenaltyTables of a number of timeslots and gap penalty."""
+    return DayPenaltyTables(n_timeslots, third_gap_penalty)
@@ -0,0 +1,278 @@
+from __future__ import annotations
+from libraries.classes.student import Student
+from libraries.classes.course import Course
+from libraries.classes.hall import Hall
+from libraries.classes.geometry import SlotGeometry, get_slot_geometry
+from libraries.helpers.load_data import load_courses, load_students, load_halls
+from libraries.helpers.problem_cache import (
+    load_compiled_problem,
+    save_compiled_problem,
+)
+from typing import Optional
+import numpy as np
+
+
+class ProblemInstance:
+    """The static data of a timetabling problem.
+
+    Contains everything that does not change while a schedule is optimised.
+    After loading the instance is read-only, so a single instance can be shared
+    by any number of models.
+
+    Attributes:
+        courses (dict[str, Course]): A mapping of a course name to a Course object.
+        students (dict[int, Student]):
+            A mapping of a student index (based on loading order) to a Student object.
+        halls (dict[int, Hall]):
+            A mapping of a hall index (based on loading order) to a Hall object.
+        geometry (SlotGeometry): Lookup tables of the day, timeslot, hall and
+            hall capacity of each schedule slot index.
+        activities (list[tuple[str, str]]): Activities ordered by their activity id.
+            An activity is represented as ('Course name', 'Activity').
+        activity_ids (dict[tuple[str, str], int]): A mapping of an activity to its id.
+        activity_enrollments (dict[tuple[str, str], frozenset[int]]):
+            A dictionary containing activities and their set of students.
+            Students are represented by their index number.
+        activity_students (tuple[frozenset[int], ...]): The set of students of
+            each activity, indexed by activity id.
+        activity_sizes (np.ndarray): Number of students enrolled per activity id.
+            Has one trailing zero, so indexing with an empty slot (-1) returns 0.
+        enrollment_matrix (np.ndarray): Boolean student x activity id incidence matrix.
+            True if the student is enrolled in the activity.
+        enrollment_matrix_float32 (np.ndarray): enrollment_matrix as a float32
+            array, for matrix products. Counts are small integers, so the
+            products are exact.
+        student_activities (dict[int, tuple[int, ...]]): A mapping of a student index
+            to the ids of the activities the student is enrolled in.
+        activity_overlap (np.ndarray): Symmetric activity id x activity id matrix of
+            the number of students enrolled in both activities.
+        activity_course_differs (np.ndarray): Boolean activity id x activity id matrix.
+            True if both activities belong to different courses.
+        zobrist_keys (tuple[tuple[int, ...], ...]): Random 64-bit key of each
+            index and activity id, used to hash schedules.
+        zobrist_key_array (np.ndarray): zobrist_keys as an unsigned 64-bit array.
+        frozen (bool): True once loading has finished and the instance is read-only.
+    """
+
+    def __init__(
+        self,
+        path: str = "data",
+        auto_load_students: bool = True,
+        use_cache: bool = True,
+        n_days: int = 5,
+        n_timeslots: int = 5,
+        n_evening_timeslots: int = 1,
+        evening_halls: Optional[tuple[int, ...]] = None,
+    ) -> None:
+        """Load a problem instance.
+
+        With auto_load_students and use_cache, the instance is loaded from the
+        compiled problem in the data folder. The compiled problem is (re)built from
+        the csv files if it is missing or outdated.
+
+        Args:
+            path (str): Path for data to load. Defaults to "data".
+            auto_load_students (bool): evaluate if  students have to be added to
+                their respective activities. Defaults to True.
+            use_cache (bool): Evaluate if the compiled problem may be used and
+                written. Defaults to True.
+            n_days (int): Number of days in a schedule. Defaults to 5.
+            n_timeslots (int): Number of timeslots in a day, including evening
+                timeslots. Defaults to 5.
+            n_evening_timeslots (int): Number of evening timeslots at the end of
+                a day. Defaults to 1.
+            evening_halls (tuple[int, ...]): Halls available in evening timeslots.
+                Defaults to None, in which case only the largest hall is available.
+
+        Raises:
+            Exception: The schedule has fewer indices than there are activities.
+        """
+        self.frozen: bool = False
+        use_cache = use_cache and auto_load_students
+        compiled = load_compiled_problem(path) if use_cache else None
+
+        if compiled is not None:
+            self.courses, self.students, self.halls, enrollment_matrix = compiled
+        else:
+            self.courses: dict[str, Course] = load_courses(path)
+            self.students: dict[int, Student] = load_students(self.courses, path)
+            self.halls: dict[int, Hall] = load_halls(path)
+        self.geometry: SlotGeometry = get_slot_geometry(
+            tuple(hall.capacity for hall in self.halls.values()),
+            n_days,
+            n_timeslots,
+            n_evening_timeslots,
+            evening_halls,
+        )
+        self.activity_enrollments: dict[
+            tuple[str, str], set[int]
+        ] = self.init_student_model()
+        self.activities: list[tuple[str, str]] = list(self.activity_enrollments)
+        if self.geometry.n_slots < len(self.activities):
+            raise Exception(
+                f"A schedule of {n_days} days with {n_timeslots} timeslots has "
+                f"{self.geometry.n_slots} indices, too few for "
+                f"{len(self.activities)} activities."
+            )
+        self.activity_ids: dict[tuple[str, str], int] = {
+            activity: activity_id
+            for activity_id, activity in enumerate(self.activities)
+        }
+        self.activity_sizes: np.ndarray = np.zeros(
+            len(self.activities) + 1, dtype=int
+        )
+        self.enrollment_matrix: np.ndarray = np.zeros(
+            (len(self.students), len(self.activities)), dtype=bool
+        )
+        self.student_activities: dict[int, tuple[int, ...]] = {
+            int(student): () for student in self.students
+        }
+
+        if compiled is not None:
+            self.load_enrollment_matrix(enrollment_matrix)
+        elif auto_load_students is True:
+            # Add members to activities in self.activity_enrollments.
+            self.add_all_students_to_activities()
+            if use_cache:
+                self.save_compiled(path)
+
+        self.freeze()
+
+        self.activity_overlap: np.ndarray = self.calc_activity_overlap()
+        self.activity_course_differs: np.ndarray = self.calc_activity_course_differs()
+        self.zobrist_key_array: np.ndarray = self.init_zobrist_keys()
+        self.zobrist_keys: tuple[tuple[int, ...], ...] = tuple(
+            tuple(keys) for keys in self.zobrist_key_array.tolist()
+        )
+
+    def init_student_model(self) -> dict[tuple[str, str], set[int]]:
+        """Initiate an activity mapping to a set of students.
+
+        Activities are structured as a tuple('Heuristieken', 'lecture 1').
+
+        Returns:
+            dict[tuple[str, str], set[str]]:
+                Activity (as unique tuple of course-activity) and a set of student indices.
+        """
+        participants: dict[tuple[str, str], set[int]] = {}
+        for course in self.courses.values():
+            for activity in course.activities():
+                participants.update({(course.name, activity.category): set()})
+
+        return participants
+
+    def add_all_students_to_activities(self) -> None:
+        """Add all students to activities.
+
+        Only the students of the course of an activity are considered.
+        """
+        for activity_tuple in self.activity_enrollments:
+            for student in self.courses[activity_tuple[0]].students:
+                self.add_student_to_activity(int(student), activity_tuple)
+
+    def check_student_in_course(self, student: int, course) -> bool:
+        """Return bool if student in specified course."""
+        return True if student in self.courses[course].students else False
+
+    def add_student_to_activity(
+        self, student: int, activity: tuple[str, str]
+    ) -> bool:
+        """Add student to an activity while loading the instance.
+
+        Args:
+            student (int): Index id of a student.
+            activity (tuple[str, str]) : tuple("course name", "lecture 1)
+
+        Returns:
+            bool: True if student not in activity yet, False otherwise.
+
+        Raises:
+            Exception: The instance is read-only.
+        """
+        if self.frozen is True:
+            raise Exception("Problem instance is read-only.")
+
+        if student not in self.activity_enrollments[
+            activity
+        ] and self.check_student_in_course(student, activity[0]):
+            self.activity_enrollments[activity].add(student)
+            self.activity_sizes[self.activity_ids[activity]] += 1
+            self.enrollment_matrix[student, self.activity_ids[activity]] = True
+            self.student_activities[student] += (self.activity_ids[activity],)
+            return True
+        else:
+            return False
+
+    def calc_activity_overlap(self) -> np.ndarray:
+        """Return a read-only matrix of the number of students shared by two activities."""
+        enrollments = self.enrollment_matrix_float32
+        overlap = (enrollments.T @ enrollments).astype(int)
+        overlap.setflags(write=False)
+        return overlap
+
+    def calc_activity_course_differs(self) -> np.ndarray:
+        """Return a read-only matrix marking activity pairs from different courses."""
+        courses = np.array([course for course, _ in self.activities])
+        differs = courses[:, np.newaxis] != courses[np.newaxis, :]
+        differs.setflags(write=False)
+        return differs
+
+    def init_zobrist_keys(self, seed: int = 0) -> np.ndarray:
+        """Return a read-only array of random 64-bit keys per index and activity id.
+
+        The keys are drawn from a separate generator with a fixed seed, so every
+        instance hashes schedules identically and the random module is untouched.
+
+        Args:
+            seed (int): Seed of the key generator. Defaults to 0.
+        """
+        keys = np.random.default_rng(seed).integers(
+            0,
+            np.iinfo(np.uint64).max,
+            size=(self.geometry.n_slots, len(self.activities)),
+            dtype=np.uint64,
+            endpoint=True,
+        )
+        keys.setflags(write=False)
+        return keys
+
+    def load_enrollment_matrix(self, enrollment_matrix: np.ndarray) -> None:
+        """Derive the enrollments of all activities from a compiled enrollment matrix.
+
+        Args:
+            enrollment_matrix (np.ndarray): Boolean student x activity id matrix.
+        """
+        self.enrollment_matrix = enrollment_matrix
+        self.activity_sizes[:-1] = enrollment_matrix.sum(axis=0)
+
+        activity_ids, students = np.nonzero(enrollment_matrix.T)
+        for activity_id, student in zip(activity_ids.tolist(), students.tolist()):
+            self.activity_enrollments[self.activities[activity_id]].add(student)
+            self.student_activities[student] += (activity_id,)
+
+    def save_compiled(self, path: str = "data") -> None:
+        """Compile the loaded instance into the data folder, if it is writable."""
+        try:
+            save_compiled_problem(
+                self.courses, self.students, self.halls, self.enrollment_matrix, path
+            )
+        except OSError:
+            # A read-only data folder only means loading stays slow.
+            pass
+
+    def freeze(self) -> None:
+        """Mark the instance as read-only."""
+        self.activity_enrollments = {
+            activity: frozenset(students)
+            for activity, students in self.activity_enrollments.items()
+        }
+        self.activity_students: tuple[frozenset[int], ...] = tuple(
+            self.activity_enrollments.values()
+        )
+        self.activity_sizes.setflags(write=False)
+        self.enrollment_matrix.setflags(write=False)
+        self.enrollment_matrix_float32: np.ndarray = self.enrollment_matrix.astype(
+            np.float32
+        )
+        self.enrollment_matrix_float32.setflags(write=False)
+        self.frozen = True
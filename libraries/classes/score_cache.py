@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from typing import Optional
+from libraries.classes.penalty_breakdown import PenaltyBreakdown
+
+
+class ScoreCache:
+    """A bounded least recently used memo of penalty breakdowns of schedules.
+
+    Schedules are identified by their Zobrist hash, so a schedule that is visited
+    again is scored with a dictionary lookup instead of a full calculation.
+
+    Attributes:
+        maxsize (int): Maximum number of stored breakdowns. When full, the least
+            recently used breakdown is discarded.
+        hits (int): Number of lookups that found a stored breakdown.
+        misses (int): Number of lookups that did not find a stored breakdown.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        """Initialise an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of stored breakdowns. Defaults to 65536.
+        """
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._breakdowns: OrderedDict[int, PenaltyBreakdown] = OrderedDict()
+
+    def get(self, key: int) -> Optional[PenaltyBreakdown]:
+        """Return the stored breakdown of a schedule hash, None if not stored."""
+        breakdown = self._breakdowns.get(key)
+        if breakdown is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._breakdowns.move_to_end(key)
+        return breakdown
+
+    def put(self, key: int, breakdown: PenaltyBreakdown) -> None:
+        """Store the breakdown of a schedule hash."""
+        self._breakdowns[key] = breakdown
+        self._breakdowns.move_to_end(key)
+        if len(self._breakdowns) > self.maxsize:
+            self._breakdowns.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups that found a stored breakdown."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_counters(self) -> None:
+        """Set the hit and miss counters to zero, keeping stored breakdowns."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Remove all stored breakdowns and reset the counters."""
+        self._breakdowns.clear()
+        self.reset_counters()
+
+    def __len__(self) -> int:
+        return len(self._breakdowns)
+
+    def __repr__(self) -> str:
+        return (
+            f"ScoreCache(size={len(self)}, hits={self.hits}, misses={self.misses})"
+        )
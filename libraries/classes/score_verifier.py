@@ -0,0 +1,81 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from libraries.classes.penalty_breakdown import PenaltyBreakdown
+import random
+
+if TYPE_CHECKING:
+    from libraries.classes.model import Model
+
+
+class ScoreVerifier:
+    """Shadow check of incrementally updated or memoised scores of a model.
+
+    At a sampling rate, the fast score of a model is compared with a full
+    recalculation on a copy of the model. The recalculation scores one student
+    at a time instead of through the vectorised scorer, and bypasses the score
+    memo. A mismatch raises an exception naming the move after which it occurred
+    and both penalty breakdowns.
+
+    Samples are drawn from a private random generator, so enabling verification
+    does not change the random choices of the algorithms.
+
+    Attributes:
+        rate (float): Fraction of scores to verify, between 0 and 1.
+        checks (int): Number of scores verified.
+    """
+
+    def __init__(self, rate: float, seed: int = 0) -> None:
+        """Initialise a verifier.
+
+        Args:
+            rate (float): Fraction of scores to verify, between 0 and 1.
+            seed (int): Seed of the sampling generator. Defaults to 0.
+
+        Raises:
+            Exception: The rate is not between 0 and 1.
+        """
+        if not 0 <= rate <= 1:
+            raise Exception("The verification rate has to be between 0 and 1.")
+        self.rate: float = rate
+        self.checks: int = 0
+        self._rng: random.Random = random.Random(seed)
+
+    def sample(self, model: Model, fast: PenaltyBreakdown, move: str) -> None:
+        """Verify the score of a model at the sampling rate.
+
+        Args:
+            model (Model): Model of which the score is verified.
+            fast (PenaltyBreakdown): Score of the model found without a full calculation.
+            move (str): Description of the move that led to the score.
+        """
+        if self._rng.random() < self.rate:
+            self.verify(model, fast, move)
+
+    def verify(self, model: Model, fast: PenaltyBreakdown, move: str) -> None:
+        """Compare the score of a model with a full recalculation.
+
+        Args:
+            model (Model): Model of which the score is verified.
+            fast (PenaltyBreakdown): Score of the model found without a full calculation.
+            move (str): Description of the move that led to the score.
+
+        Raises:
+            Exception: The score differs from a full recalculation.
+        """
+        self.checks += 1
+        # Score a copy without calc_total_penalty, which would fill the score memo.
+        reference = model.copy()
+        student_penalties = reference.calc_student_schedule_penalties_per_student()
+        full = PenaltyBreakdown(
+            capacity=reference.calc_total_capacity_penalties(),
+            evening=reference.calc_evening_penalties(),
+            conflict=student_penalties["conflict penalties"],
+            gap=student_penalties["gap penalties"],
+        )
+
+        if fast != full or model.penalty_points != full.total:
+            raise Exception(
+                f"Score after {move} does not match a full recalculation.\n"
+                f"  fast: {fast} (penalty points {model.penalty_points})\n"
+                f"  full: {full} (penalty points {full.total})"
+            )
@@ -6,6 +6,15 @@ if TYPE_CHECKING:
 
 
 class Student:
+    __slots__ = (
+        "index",
+        "first_name",
+        "last_name",
+        "student_number",
+        "courses",
+        "activities",
+    )
+
     def __init__(
         self,
         index: int,
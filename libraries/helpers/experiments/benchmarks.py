@@ -0,0 +1,272 @@
+from libraries.classes.model import Model
+from libraries.classes.problem_instance import ProblemInstance
+from libraries.algorithms.randomise import Random
+from libraries.algorithms.greedy import Greedy
+from libraries.algorithms.hillclimber import HillClimber
+from libraries.helpers.generate_instance import generate_instance
+import contextlib
+import io
+import math
+import random
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+
+def time_call(function, repeats: int = 20) -> float:
+    """Return the fastest time of a function call in milliseconds.
+
+    Args:
+        function (Callable): Function to call without arguments.
+        repeats (int): Number of calls to time. Defaults to 20.
+    """
+    return min(timeit.repeat(function, number=1, repeat=repeats)) * 1000
+
+
+def benchmark_model_construction(
+    path: str = "data", repeats: int = 20
+) -> dict[str, float]:
+    """Time the different ways of constructing an empty model.
+
+    Args:
+        path (str): Path of the data to load. Defaults to "data".
+        repeats (int): Number of constructions to time per way. Defaults to 20.
+
+    Returns:
+        dict[str, float]: Mapping of each way of construction to its fastest time in ms.
+    """
+    # Ensure the compiled problem exists and is up to date.
+    model = Model(path)
+
+    return {
+        "Model() from csv": time_call(
+            lambda: Model(instance=ProblemInstance(path, use_cache=False)), repeats
+        ),
+        "Model() from compiled cache": time_call(lambda: Model(path), repeats),
+        "Model.from_instance": time_call(
+            lambda: Model.from_instance(model.instance), repeats
+        ),
+        "Model.empty_like": time_call(model.empty_like, repeats),
+        "Model.copy": time_call(model.copy, repeats),
+    }
+
+
+def measure_model_memory(path: str = "data", n_copies: int = 10000) -> dict[str, int]:
+    """Measure the memory allocated by a loaded model and by many copies of it.
+
+    Args:
+        path (str): Path of the data to load. Defaults to "data".
+        n_copies (int): Number of copies to keep alive at once. Defaults to 10000.
+
+    Returns:
+        dict[str, int]: Mapping of each measurement to the allocated bytes.
+    """
+    # Ensure the compiled problem exists, so the loaded model is measured on its own.
+    Model(path)
+
+    tracemalloc.start()
+    model = Model(instance=ProblemInstance(path, use_cache=False))
+    loaded_from_csv, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    model = Model(path)
+    loaded, _ = tracemalloc.get_traced_memory()
+
+    copies = [model.copy() for _ in range(n_copies)]
+    with_copies, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "loaded model from csv": loaded_from_csv,
+        "loaded model from compiled cache": loaded,
+        f"{len(copies)} model copies": with_copies - loaded,
+    }
+
+
+def benchmark_geometry_scaling(
+    path: str = "data",
+    layouts: tuple[tuple[int, int], ...] = ((5, 5), (20, 11)),
+    repeats: int = 20,
+) -> dict[str, dict[str, float]]:
+    """Time scoring operations on a randomly filled schedule for several grid sizes.
+
+    The default layouts are the current grid of 5 days of 5 timeslots (145 indices)
+    and 20 days of 11 timeslots (1420 indices), about 10 times as large.
+
+    Args:
+        path (str): Path of the data to load. Defaults to "data".
+        layouts (tuple[tuple[int, int], ...]): Number of days and timeslots per grid.
+        repeats (int): Number of calls to time per operation. Defaults to 20.
+
+    Returns:
+        dict[str, dict[str, float]]: Mapping of each grid to the fastest time in ms
+            of each operation.
+    """
+    results = {}
+    for n_days, n_timeslots in layouts:
+        instance = ProblemInstance(path, n_days=n_days, n_timeslots=n_timeslots)
+        model = Model.from_instance(instance)
+        n_slots = model.geometry.n_slots
+
+        # Fill the schedule randomly, with a fixed seed for comparable runs.
+        rng = random.Random(0)
+        for activity in range(len(model.activities)):
+            while model.add_activity(rng.randrange(n_slots), activity) is False:
+                pass
+        model.calc_total_penalty()
+
+        swaps = [(rng.randrange(n_slots), rng.randrange(n_slots)) for _ in range(repeats)]
+        schedules = [model.schedule.copy() for _ in range(100)]
+        for schedule in schedules:
+            rng.shuffle(schedule)
+
+        results[f"{n_days} days x {n_timeslots} timeslots ({n_slots} indices)"] = {
+            "ProblemInstance()": time_call(
+                lambda: ProblemInstance(path, n_days=n_days, n_timeslots=n_timeslots),
+                repeats,
+            ),
+            "calc_total_penalty": time_call(model.calc_total_penalty, repeats),
+            "calc_swaps_delta": time_call(
+                lambda: model.calc_swaps_delta([swaps[rng.randrange(repeats)]]),
+                repeats,
+            ),
+            "calc_penalty_breakdowns (100)": time_call(
+                lambda: model.calc_penalty_breakdowns(schedules), repeats
+            ),
+            "get_high_capacity_empty_index": time_call(
+                model.get_high_capacity_empty_index, repeats
+            ),
+        }
+
+    return results
+
+
+def measure_run(function, seed: int = 0) -> tuple[float, int, object]:
+    """Run a function twice with the same seed, for its time and its peak memory.
+
+    The run is timed without tracing, as tracemalloc slows down allocations.
+    Output of the function is discarded.
+
+    Args:
+        function (Callable): Function to call without arguments.
+        seed (int): Seed of the random module before each run. Defaults to 0.
+
+    Returns:
+        tuple[float, int, object]: Time in seconds, peak allocated bytes and
+            the return value of the function.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        random.seed(seed)
+        start_time = time.perf_counter()
+        function()
+        runtime = time.perf_counter() - start_time
+
+        random.seed(seed)
+        tracemalloc.start()
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return runtime, peak, result
+
+
+def benchmark_instance_scaling(
+    scales: tuple[int, ...] = (1, 10, 100),
+    hillclimber_iterations: int = 1000,
+    max_greedy_scale: int = 10,
+    seed: int = 0,
+) -> dict[int, dict[str, dict[str, float]]]:
+    """Measure how loading, scoring and the algorithms scale with the instance size.
+
+    For every scale a synthetic instance is generated with the number of students
+    multiplied by the scale, and the numbers of courses and halls multiplied by its
+    square root. The activities per index then stay roughly the same, while the
+    students per activity grow with the scale.
+
+    Args:
+        scales (tuple[int, ...]): Factors of the size of the real data to measure.
+            Defaults to 1, 10 and 100.
+        hillclimber_iterations (int): Iterations of the HillClimber. Defaults to 1000.
+        max_greedy_scale (int): Largest scale at which Greedy is run, as it scores
+            every empty index for every activity. Defaults to 10.
+        seed (int): Seed of the generated instances and the algorithms. Defaults to 0.
+
+    Returns:
+        dict[int, dict[str, dict[str, float]]]: Mapping of each scale to each
+            measurement, which maps to 'seconds', 'MiB' and, for the algorithms,
+            'penalty points'.
+    """
+    results = {}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as path:
+            generate_instance(
+                path,
+                n_courses=round(29 * math.sqrt(scale)),
+                n_students=609 * scale,
+                n_halls=round(7 * math.sqrt(scale)),
+                seed=seed,
+            )
+            runtime, peak, instance = measure_run(
+                lambda: ProblemInstance(path, use_cache=False), seed
+            )
+        model = Model.from_instance(instance)
+        measurements = {"ProblemInstance()": {"seconds": runtime, "MiB": peak / 2**20}}
+
+        runtime, peak, random_model = measure_run(
+            lambda: Random(model).run(runs=1), seed
+        )
+        measurements["Random"] = {
+            "seconds": runtime,
+            "MiB": peak / 2**20,
+            "penalty points": random_model.penalty_points,
+        }
+
+        for operation, function in (
+            ("calc_total_penalty", random_model.calc_total_penalty),
+            ("Model.copy", random_model.copy),
+        ):
+            runtime, peak, _ = measure_run(function, seed)
+            measurements[operation] = {"seconds": runtime, "MiB": peak / 2**20}
+
+        if scale <= max_greedy_scale:
+            runtime, peak, greedy_model = measure_run(lambda: Greedy(model).run(), seed)
+            measurements["Greedy"] = {
+                "seconds": runtime,
+                "MiB": peak / 2**20,
+                "penalty points": greedy_model.penalty_points,
+            }
+
+        runtime, peak, (hillclimber_model, _) = measure_run(
+            lambda: HillClimber(random_model).run(iterations=hillclimber_iterations),
+            seed,
+        )
+        measurements[f"HillClimber ({hillclimber_iterations} iterations)"] = {
+            "seconds": runtime,
+            "MiB": peak / 2**20,
+            "penalty points": hillclimber_model.penalty_points,
+        }
+
+        results[scale] = measurements
+
+    return results
+
+
+if __name__ == "__main__":
+    for construction, milliseconds in benchmark_model_construction().items():
+        print(f"{construction:<30}{milliseconds:>10.3f} ms")
+    for measurement, n_bytes in measure_model_memory().items():
+        print(f"{measurement:<35}{n_bytes / 2**20:>10.2f} MiB")
+    for grid, timings in benchmark_geometry_scaling().items():
+        print(grid)
+        for operation, milliseconds in timings.items():
+            print(f"    {operation:<35}{milliseconds:>10.3f} ms")
+    for scale, measurements in benchmark_instance_scaling().items():
+        print(f"{scale}x instance size")
+        for measurement, values in measurements.items():
+            print(
+                f"    {measurement:<35}{values['seconds']:>10.4f} s"
+                f"{values['MiB']:>10.2f} MiB"
+                f"{values.get('penalty points', ''):>10}"
+            )
@@ -56,8 +56,9 @@ def iter_tuner(
         list[int]: A list at which iteration convergence was found."""
     random.seed(seed)
     converged_iterations: list[int] = []
+    empty_model = Model()
     for _ in range(runs):
-        model = Random(Model()).run()
+        model = Random(empty_model.empty_like()).run()
         converged_iteration = HillClimber_Tuner(model).run(
             convergence=convergence, verbose=verbose
         )
@@ -0,0 +1,170 @@
+"""This is a module containing a helper function to generate synthetic problem instances.
+
+The generated data folder contains 'vakken.csv', 'studenten_en_vakken.csv' and
+'zalen.csv' in the same format as the data folder, so it is loaded like the real data.
+The same seed and arguments always result in the same files.
+
+Instances are shaped by the following settings:
+- size: the number of courses, students and halls.
+- enrollment skew: courses are ranked by popularity, the popularity of the course
+    at rank r being 1 / r ** skew. A skew of 0 spreads the students evenly.
+- course overlap: courses are grouped in programmes of about 6 courses. After the
+    first course of a student, every next course is chosen from the same programme
+    with this probability. A high overlap results in many students following
+    the same combinations of courses.
+
+This module contains the following functions:
+generate_instance -> None
+"""
+
+from bisect import bisect_left
+from itertools import accumulate
+import csv
+import os
+import random
+
+COURSES_PER_PROGRAMME = 6
+
+# Weights of 1 - 5 courses per student, close to the distribution in the real data.
+COURSES_PER_STUDENT_WEIGHTS = (5, 4, 3, 2, 1)
+# Weights of 0 - 3 lectures and 0 - 1 tutorials or practicals of a course.
+LECTURE_WEIGHTS = (6, 9, 12, 2)
+TUTORIAL_WEIGHTS = (12, 17)
+PRACTICAL_WEIGHTS = (10, 19)
+GROUP_SIZES = (10, 15, 20, 25, 40)
+
+
+def _choose(rng: random.Random, cumulative_weights: list[float]) -> int:
+    """Return a random position, weighted by the cumulative weights."""
+    return bisect_left(cumulative_weights, rng.random() * cumulative_weights[-1])
+
+
+def generate_instance(
+    path: str,
+    n_courses: int = 29,
+    n_students: int = 609,
+    n_halls: int = 7,
+    enrollment_skew: float = 1.0,
+    course_overlap: float = 0.5,
+    seed: int = 0,
+) -> None:
+    """Write a synthetic problem instance to a data folder.
+
+    Args:
+        path (str): Path of the data folder to write, created if it does not exist.
+        n_courses (int): Number of courses. Defaults to 29.
+        n_students (int): Number of students. Defaults to 609.
+        n_halls (int): Number of halls. Defaults to 7.
+        enrollment_skew (float): Skew of the popularity of courses. Defaults to 1.0.
+        course_overlap (float): Probability that a next course of a student is
+            chosen from the programme of the first course. Defaults to 0.5.
+        seed (int): Seed of the random generator. Defaults to 0.
+
+    Raises:
+        Exception: A size is smaller than 1, or course_overlap is not a probability.
+    """
+    if min(n_courses, n_students, n_halls) < 1:
+        raise Exception("An instance needs at least one course, student and hall.")
+    if not 0 <= course_overlap <= 1:
+        raise Exception("The course overlap has to be between 0 and 1.")
+
+    rng = random.Random(seed)
+    os.makedirs(path, exist_ok=True)
+
+    # Rank the courses by popularity in a random order.
+    names = [f"Course {number + 1}" for number in range(n_courses)]
+    ranks = list(range(n_courses))
+    rng.shuffle(ranks)
+    popularity = [1 / (rank + 1) ** enrollment_skew for rank in ranks]
+    cumulative_popularity = list(accumulate(popularity))
+
+    # Group the courses in programmes.
+    n_programmes = max(1, n_courses // COURSES_PER_PROGRAMME)
+    programmes = [
+        list(range(programme, n_courses, n_programmes))
+        for programme in range(n_programmes)
+    ]
+    cumulative_programme_popularity = [
+        list(accumulate(popularity[course] for course in programme))
+        for programme in programmes
+    ]
+
+    cumulative_n_courses = list(accumulate(COURSES_PER_STUDENT_WEIGHTS))
+    enrollments = [0] * n_courses
+    with open(f"{path}/studenten_en_vakken.csv", "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ["Achternaam", "Voornaam", "Stud.Nr."]
+            + [f"Vak{i+1}" for i in range(len(COURSES_PER_STUDENT_WEIGHTS))]
+        )
+        for student in range(n_students):
+            n_student_courses = min(_choose(rng, cumulative_n_courses) + 1, n_courses)
+            courses = [_choose(rng, cumulative_popularity)]
+            programme = courses[0] % n_programmes
+            while len(courses) < n_student_courses:
+                programme_full = all(
+                    course in courses for course in programmes[programme]
+                )
+                if not programme_full and rng.random() < course_overlap:
+                    position = _choose(rng, cumulative_programme_popularity[programme])
+                    course = programmes[programme][position]
+                else:
+                    course = _choose(rng, cumulative_popularity)
+                # Redraw courses the student already follows.
+                if course not in courses:
+                    courses.append(course)
+
+            for course in courses:
+                enrollments[course] += 1
+            writer.writerow(
+                [f"Student {student + 1}", "Synthetic", 10000000 + student]
+                + [names[course] for course in courses]
+                + [""] * (len(COURSES_PER_STUDENT_WEIGHTS) - len(courses))
+            )
+
+    cumulative_lectures = list(accumulate(LECTURE_WEIGHTS))
+    cumulative_tutorials = list(accumulate(TUTORIAL_WEIGHTS))
+    cumulative_practicals = list(accumulate(PRACTICAL_WEIGHTS))
+    with open(f"{path}/vakken.csv", "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            [
+                "Vak",
+                "#Hoorcolleges",
+                "#Werkcolleges",
+                "Max. stud. Werkcollege",
+                "#Practica",
+                "Max. stud. Practicum",
+                "Verwacht",
+            ]
+        )
+        for course in range(n_courses):
+            n_lectures = _choose(rng, cumulative_lectures)
+            n_tutorials = _choose(rng, cumulative_tutorials)
+            n_practicals = _choose(rng, cumulative_practicals)
+            if n_lectures + n_tutorials + n_practicals == 0:
+                # Every course has at least one activity.
+                n_lectures = 1
+            writer.writerow(
+                [
+                    names[course],
+                    n_lectures,
+                    n_tutorials,
+                    rng.choice(GROUP_SIZES) if n_tutorials else "",
+                    n_practicals,
+                    rng.choice(GROUP_SIZES) if n_practicals else "",
+                    enrollments[course],
+                ]
+            )
+
+    # Halls are sized to the enrollments of random courses, one fits the largest course.
+    capacities = [max(enrollments)] + [
+        max(10, round(enrollments[rng.randrange(n_courses)] * rng.uniform(0.6, 1.2)))
+        for _ in range(n_halls - 1)
+    ]
+    rng.shuffle(capacities)
+    with open(f"{path}/zalen.csv", "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Zaalnummer", "Max. capaciteit"])
+        for hall, capacity in enumerate(capacities):
+            writer.writerow([f"H{hall + 1:03d}", capacity])
@@ -0,0 +1,71 @@
+"""This is a module containing a helper function to report where startup time goes.
+
+The command is run again in a new interpreter with Python's '-X importtime' option.
+The timings it writes are collected per imported module and the slowest
+modules are printed, together with the total import time.
+
+This module contains the following functions:
+report_import_times -> list[tuple[str, int, int]]
+"""
+
+import subprocess
+import sys
+
+
+def report_import_times(
+    command: list[str], top: int = 15, verbose: bool = True
+) -> list[tuple[str, int, int]]:
+    """Run a python command and report the modules that took the longest to import.
+
+    Args:
+        command (list[str]): Script and arguments to run, e.g. ['main.py', 'random'].
+        top (int): Number of modules to report. Defaults to 15.
+        verbose (bool): Evaluate if the report has to be printed. Defaults to True.
+
+    Returns:
+        list[tuple[str, int, int]]: The slowest modules as (module, self time,
+            cumulative time), times in microseconds, ordered by cumulative time.
+
+    Raises:
+        SystemExit: The command failed. Its error output is printed instead of
+            the timings, and its exit code is passed on.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        capture_output=True,
+        text=True,
+    )
+
+    if process.returncode != 0:
+        # Show the traceback of the command without the import timings.
+        print(
+            "\n".join(
+                line
+                for line in process.stderr.splitlines()
+                if not line.startswith("import time:")
+            ),
+            file=sys.stderr,
+        )
+        sys.exit(process.returncode)
+
+    timings: list[tuple[str, int, int]] = []
+    total = 0
+    for line in process.stderr.splitlines():
+        # Format: 'import time: <self us> | <cumulative us> | <indented module>'
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, module = line[len("import time:") :].split("|")
+        timings.append((module.strip(), int(self_time), int(cumulative_time)))
+        if not module[1:].startswith(" "):
+            # Only top-level imports add to the total.
+            total += int(cumulative_time)
+
+    timings.sort(key=lambda timing: timing[2], reverse=True)
+
+    if verbose:
+        print(f"Total import time: {total / 1000:.1f} ms")
+        print(f"{'module':<50}{'self [ms]':>12}{'cumulative [ms]':>18}")
+        for module, self_time, cumulative_time in timings[:top]:
+            print(f"{module:<50}{self_time / 1000:>12.1f}{cumulative_time / 1000:>18.1f}")
+
+    return timings[:top]
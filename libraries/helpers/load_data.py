@@ -9,19 +9,107 @@ Furthermore, the following data should be placed in a data folder in the root fo
 A variable in a root dir script recieving the return from each loading function is all that is needed.
 Loading the data in another folder may need adjustment of the path.
 
+The csv files are streamed row by row with the csv module. Rows are validated while
+reading, a malformed row raises an exception naming the file and its line number.
+
 This module contains the following functions:
 load_courses -> dict[course name: Course object]
 load_students -> dict[index of student in csv: Student Object]
 load_halls -> dict[index of hall: Hall object]
 """
 
-import pandas as pd
+from typing import Iterator, Optional
 import csv
 from libraries.classes.course import Course
 from libraries.classes.activity import Activity
 from libraries.classes.student import Student
 from libraries.classes.hall import Hall
 
+COURSE_COLUMNS = (
+    "Vak",
+    "#Hoorcolleges",
+    "#Werkcolleges",
+    "Max. stud. Werkcollege",
+    "#Practica",
+    "Max. stud. Practicum",
+    "Verwacht",
+)
+STUDENT_COLUMNS = ("Achternaam", "Voornaam", "Stud.Nr.")
+N_STUDENT_COURSES = 5
+HALL_COLUMNS = ("Zaalnummer", "Max. capaciteit")
+
+
+def _read_rows(
+    file_path: str, columns: tuple[str, ...]
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """Stream the rows of a csv file as dictionaries mapping column to value.
+
+    Args:
+        file_path (str): Path of the csv file.
+        columns (tuple[str, ...]): Columns which the header has to contain.
+
+    Yields:
+        tuple[int, dict[str, str]]: Line number and the values of a row.
+            Empty lines are skipped.
+
+    Raises:
+        Exception: The header misses a column, or a row has a different
+            number of values than the header.
+    """
+    with open(file_path, mode="r", encoding="utf-8-sig", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            raise Exception(f"{file_path}: file is empty.")
+
+        missing = [column for column in columns if column not in header]
+        if missing:
+            raise Exception(f"{file_path}:1: missing column(s) {', '.join(missing)}.")
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(header):
+                raise Exception(
+                    f"{file_path}:{reader.line_num}: expected {len(header)} values, "
+                    f"found {len(row)}."
+                )
+            yield reader.line_num, dict(zip(header, row))
+
+
+def _parse_int(
+    value: str, column: str, location: str, required: bool = True
+) -> Optional[int]:
+    """Convert a csv value to an int.
+
+    Args:
+        value (str): Value to convert.
+        column (str): Column of the value, used in error messages.
+        location (str): File and line number of the value, used in error messages.
+        required (bool): Evaluate if an empty value is an error. Defaults to True.
+            If False, an empty value is converted to None.
+
+    Raises:
+        Exception: The value is not an integer, or is empty but required.
+    """
+    value = value.strip()
+    if value == "":
+        if required:
+            raise Exception(f"{location}: missing value in column '{column}'.")
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    # Spreadsheet exports may write whole numbers as '25.0'.
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is None or not number.is_integer():
+        raise Exception(f"{location}: '{value}' in column '{column}' is not an integer.")
+    return int(number)
+
 
 def load_courses(path: str = "data"):
     """Load courses from csv to a dictionary.
@@ -33,68 +121,83 @@ def load_courses(path: str = "data"):
     Returns:
         dict: Contains courses and their activities.
           key = coursename, value = Course obj.
+
+    Raises:
+        Exception: A row is malformed or a course occurs twice.
     """
-    d_type = {
-        "Vak": str,
-        "#Hoorcolleges": int,
-        "#Werkcolleges": int,
-        "Max stud. Werkcollege": int,
-        "#Practica": int,
-        "Max stud. Practicum": int,
-        "Verwacht": int,
-    }
-    df_courses = pd.read_csv(f"{path}/vakken.csv", dtype=d_type)
+    file_path = f"{path}/vakken.csv"
 
     courses = {}
-    for _, course in df_courses.iterrows():
+    for line_number, course in _read_rows(file_path, COURSE_COLUMNS):
+        location = f"{file_path}:{line_number}"
+        if course["Vak"] == "":
+            raise Exception(f"{location}: missing value in column 'Vak'.")
+        if course["Vak"] in courses:
+            raise Exception(f"{location}: course '{course['Vak']}' occurs twice.")
+
         courses[course["Vak"]] = Course(course_name=course["Vak"])
-        for activities in _init_activities(courses[course["Vak"]], course):
-            for activity_name, activity_set in activities.items():
-                for activity in activity_set:
+        for activities in _init_activities(courses[course["Vak"]], course, location):
+            for activity_name, activity_list in activities.items():
+                for activity in activity_list:
                     courses[course["Vak"]].add_activity(activity_name, activity)
 
     return courses
 
 
-def _init_activities(course_obj: Course, course: pd.Series):
+def _init_activities(course_obj: Course, course: dict[str, str], location: str):
     """Generate activity objects in list for a course.
 
     Args:
         course_obj (Course): Course object.
-        course (pd.Series): Row containing course data.
+        course (dict[str, str]): Row containing course data.
+        location (str): File and line number of the row, used in error messages.
 
     Returns:
         tuple: list of lectures, list of tutorials, list of practicals.
     """
-    n_lectures = course["#Hoorcolleges"]
-    n_practicals = course["#Practica"]
-    n_tutorials = course["#Werkcolleges"]
+    n_lectures = _parse_int(course["#Hoorcolleges"], "#Hoorcolleges", location)
+    n_practicals = _parse_int(course["#Practica"], "#Practica", location)
+    n_tutorials = _parse_int(course["#Werkcolleges"], "#Werkcolleges", location)
+    expected = _parse_int(course["Verwacht"], "Verwacht", location)
+    max_practical = _parse_int(
+        course["Max. stud. Practicum"], "Max. stud. Practicum", location, n_practicals > 0
+    )
+    max_tutorial = _parse_int(
+        course["Max. stud. Werkcollege"],
+        "Max. stud. Werkcollege",
+        location,
+        n_tutorials > 0,
+    )
 
     # Add lectures.
     lectures = {
-        "lectures": {Activity(
-            course=course_obj, category=f"lecture {i+1}", capacity=course["Verwacht"]
-        )
-        for i in range(n_lectures)}
+        "lectures": [
+            Activity(course=course_obj, category=f"lecture {i+1}", capacity=expected)
+            for i in range(n_lectures)
+        ]
     }
 
     # Add practicals.
     practicals = {
-        "practicals": {Activity(
-            course=course_obj,
-            category=f"practical {i+1}",
-            capacity=course["Max. stud. Practicum"],
-        )
-        for i in range(n_practicals)}
+        "practicals": [
+            Activity(
+                course=course_obj,
+                category=f"practical {i+1}",
+                capacity=max_practical,
+            )
+            for i in range(n_practicals)
+        ]
     }
     # Add tutorials.
     tutorials = {
-        "tutorials": {Activity(
-            course=course_obj,
-            category=f"tutorial {i+1}",
-            capacity=course["Max. stud. Werkcollege"],
-        )
-        for i in range(n_tutorials)}
+        "tutorials": [
+            Activity(
+                course=course_obj,
+                category=f"tutorial {i+1}",
+                capacity=max_tutorial,
+            )
+            for i in range(n_tutorials)
+        ]
     }
 
     return lectures, tutorials, practicals
@@ -111,17 +214,24 @@ def load_students(courses, path: str = "data"):
     Returns:
         dict: Contains courses and their activities.
           key = student index, value = Student obj.
+
+    Raises:
+        Exception: A row is malformed or names an unknown course.
     """
-    df_students = pd.read_csv(f"{path}/studenten_en_vakken.csv")
+    file_path = f"{path}/studenten_en_vakken.csv"
+    course_columns = tuple(f"Vak{i+1}" for i in range(N_STUDENT_COURSES))
 
     students = {}
-    for index, student in df_students.iterrows():
-        subjects = _load_subjects(courses, student)
+    for index, (line_number, student) in enumerate(
+        _read_rows(file_path, STUDENT_COLUMNS + course_columns)
+    ):
+        location = f"{file_path}:{line_number}"
+        subjects = _load_subjects(courses, student, course_columns, location)
         students[index] = Student(
             index=index,
             first_name=student["Voornaam"],
             last_name=student["Achternaam"],
-            student_number=student["Stud.Nr."],
+            student_number=_parse_int(student["Stud.Nr."], "Stud.Nr.", location),
             courses=subjects,
         )
 
@@ -129,12 +239,26 @@ def load_students(courses, path: str = "data"):
     return students
 
 
-def _load_subjects(courses, student):
-    return {
-        student[f"Vak{i+1}"]: courses[student[f"Vak{i+1}"]]
-        for i in range(5)
-        if isinstance(student[f"Vak{i+1}"], str)
-    }
+def _load_subjects(
+    courses: "dict[str, Course]",
+    student: dict[str, str],
+    course_columns: tuple[str, ...],
+    location: str,
+) -> "dict[str, Course]":
+    """Return the courses of a student, skipping empty course columns.
+
+    Raises:
+        Exception: A course column names a course which is not loaded.
+    """
+    subjects = {}
+    for column in course_columns:
+        course_name = student[column]
+        if course_name == "":
+            continue
+        if course_name not in courses:
+            raise Exception(f"{location}: unknown course '{course_name}' in column '{column}'.")
+        subjects[course_name] = courses[course_name]
+    return subjects
 
 
 def _update_course(courses: "dict[str, Course]", student: Student):
@@ -143,18 +267,25 @@ def _update_course(courses: "dict[str, Course]", student: Student):
 
 
 def load_halls(path: str = "data"):
-    # read halls from csv
-    halls_raw = [
-        hall
-        for hall in csv.DictReader(
-            open(f"{path}/zalen.csv", mode="r", encoding="utf-8-sig")
-        )
-    ]
+    """Load halls from csv to a dictionary.
+
+    Args:
+        path (str): Path of csv to load.
+            Defaults to "/data"
+
+    Returns:
+        dict: key = index of hall in csv, value = Hall obj.
+
+    Raises:
+        Exception: A row is malformed.
+    """
+    file_path = f"{path}/zalen.csv"
 
     # create a dictionary with halls and their capacity
     halls = {}
-    for index, hall in enumerate(halls_raw):
-        hall_name, capacity = hall.values()
-        halls.update({index: Hall(hall_name, int(capacity))})
+    for index, (line_number, hall) in enumerate(_read_rows(file_path, HALL_COLUMNS)):
+        location = f"{file_path}:{line_number}"
+        capacity = _parse_int(hall["Max. capaciteit"], "Max. capaciteit", location)
+        halls.update({index: Hall(hall["Zaalnummer"], capacity)})
 
-    return halls
\ No newline at end of file
+    return halls
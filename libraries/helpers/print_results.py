@@ -1,44 +1,52 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from libraries.classes.model import Model
-import pandas as pd
-from tabulate import tabulate
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 def print_results(algorithm_name: str, model: Model, runtime):
     """
     Prints results of a model generated with an algorithm.
     """
-    model_df = model_to_df(model)
+    from tabulate import tabulate
+
+    model_rows = model_to_rows(model)
+    breakdown = model.get_penalty_breakdown()
     print(
         f"THE BEST SCHEDULE FOUND WHEN USING {algorithm_name}:\n",
-        tabulate(model_df, tablefmt='psql', headers='keys', showindex=False),
+        tabulate(model_rows, tablefmt='psql', headers='keys', showindex=False),
         "\n POINTS: ",
-        model.calc_total_penalty(),
+        breakdown.total,
         "\n evening points:",
-        model.calc_evening_penalties(),
+        breakdown.evening,
         "\n conflict points:",
-        model.calc_student_schedule_penalties(),
+        breakdown.student_penalties(),
         "\n capacity penalty:",
-        model.calc_total_capacity_penalties(),
+        breakdown.capacity,
         "\n runtime:",
         runtime,
+        "\n score cache:",
+        f"{model.score_cache.hits} hits, {model.score_cache.misses} misses",
     )
 
-def model_to_df(model:Model):
+def model_to_df(model:Model) -> pd.DataFrame:
     """Converts model object to a pandas dataframe for pretty printing."""
+    import pandas as pd
 
-    # create a list of weekdays (column headers)
-    weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+    return pd.DataFrame(model_to_rows(model))
 
-    # create a list of timeslots (row headers)
-    timeslots = ["9-11", "11-13", "13-15", "15-17", "17-19"]
+def model_to_rows(model:Model) -> list[dict]:
+    """Converts model object to a list of rows for pretty printing."""
 
     # formatting
     list_of_dicts = []
-    for i in range(len(model.solution)):
-        info = model.translate_index(i)
-        day  = weekdays[info['day']]
-        time = timeslots[info['timeslot']]
-        hall = model.halls[info['hall']].name
-        activity = model.solution[i]
+    geometry = model.geometry
+    for i in range(geometry.n_slots):
+        day  = geometry.day_names[geometry.day_lookup[i]]
+        time = geometry.timeslot_names[geometry.timeslot_lookup[i]]
+        hall = model.halls[geometry.hall_lookup[i]].name
+        activity = model.get_activity_of_index(i)
         students = model.activity_enrollments[activity] if activity[0] else None
         list_of_dicts.append({
 
@@ -49,5 +57,4 @@ def model_to_df(model:Model):
             '#students': len(students) if students else ''
         })
 
-    # convert to df
-    return pd.DataFrame(list_of_dicts)
\ No newline at end of file
+    return list_of_dicts
\ No newline at end of file
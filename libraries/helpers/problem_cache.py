@@ -0,0 +1,203 @@
+"""This is a module containing helper functions to cache a compiled problem.
+
+Loading the csv files in the data folder is slow compared to the time needed to
+construct a model. After the first load, the courses, students, halls and the
+student x activity enrollment matrix are compiled into a binary artefact in a
+'__compiled__' folder next to the csv files. Later loads read the metadata and
+memory-map the enrollment matrix instead of parsing the csv files.
+
+The artefact stores a hash of the csv files it was compiled from and a version
+number. It is ignored, and rebuilt by the caller, when either does not match.
+
+This module contains the following functions:
+hash_source_files -> str
+save_compiled_problem -> None
+load_compiled_problem -> (courses, students, halls, enrollment matrix) or None
+"""
+
+from contextlib import contextmanager, suppress
+from typing import IO, Iterator, Optional
+import hashlib
+import json
+import math
+import os
+import tempfile
+import numpy as np
+from libraries.classes.course import Course
+from libraries.classes.activity import Activity
+from libraries.classes.student import Student
+from libraries.classes.hall import Hall
+
+# Bump when the compiled layout or the order of the activity ids changes.
+CACHE_VERSION = 2
+CACHE_FOLDER = "__compiled__"
+SOURCE_FILES = ("vakken.csv", "studenten_en_vakken.csv", "zalen.csv")
+ACTIVITY_TYPES = ("lectures", "tutorials", "practicals")
+
+
+def hash_source_files(path: str = "data") -> str:
+    """Return a hash of the contents of the csv files in a data folder.
+
+    Args:
+        path (str): Path of the data folder. Defaults to "data".
+    """
+    source_hash = hashlib.sha256()
+    for file_name in SOURCE_FILES:
+        with open(f"{path}/{file_name}", "rb") as source_file:
+            source_hash.update(source_file.read())
+    return source_hash.hexdigest()
+
+
+def _to_json_number(value) -> Optional[int]:
+    """Convert a loaded number to an int, missing values (NaN) to None."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return int(value)
+
+
+def save_compiled_problem(
+    courses: "dict[str, Course]",
+    students: "dict[int, Student]",
+    halls: "dict[int, Hall]",
+    enrollment_matrix: np.ndarray,
+    path: str = "data",
+) -> None:
+    """Compile loaded problem data into a binary artefact in the data folder.
+
+    Files are written under a unique temporary name first and the metadata is
+    written last, so an interrupted save never results in a cache that is
+    accepted, and concurrent saves do not mix each other's files.
+
+    Args:
+        courses (dict[str, Course]): Loaded courses.
+        students (dict[int, Student]): Loaded students.
+        halls (dict[int, Hall]): Loaded halls.
+        enrollment_matrix (np.ndarray): Boolean student x activity id matrix, with
+            activities ordered as they are listed in the courses.
+        path (str): Path of the data folder. Defaults to "data".
+    """
+    folder = f"{path}/{CACHE_FOLDER}"
+    os.makedirs(folder, exist_ok=True)
+
+    metadata = {
+        "version": CACHE_VERSION,
+        "source_hash": hash_source_files(path),
+        "shape": list(enrollment_matrix.shape),
+        "courses": [
+            {
+                "name": course.name,
+                **{
+                    activity_type: [
+                        [activity.category, _to_json_number(activity.capacity)]
+                        for activity in getattr(course, activity_type)
+                    ]
+                    for activity_type in ACTIVITY_TYPES
+                },
+            }
+            for course in courses.values()
+        ],
+        "students": [
+            [
+                int(student.index),
+                student.first_name,
+                student.last_name,
+                int(student.student_number),
+                list(student.courses),
+            ]
+            for student in students.values()
+        ],
+        "halls": [[hall.name, int(hall.capacity)] for hall in halls.values()],
+    }
+
+    with _temporary_file(folder, f"{folder}/enrollment_matrix.npy", "wb") as file:
+        np.save(file, np.asarray(enrollment_matrix))
+    with _temporary_file(folder, f"{folder}/metadata.json", "w") as file:
+        json.dump(metadata, file)
+
+
+@contextmanager
+def _temporary_file(folder: str, destination: str, mode: str) -> Iterator[IO]:
+    """Open a new uniquely named file in folder, and move it to destination once written.
+
+    Every writer gets its own temporary file, so processes compiling the same
+    problem at once do not overwrite each other's partial files. If writing
+    fails, the temporary file is removed and destination is left untouched.
+
+    Args:
+        folder (str): Folder of the temporary file, on the same file system as
+            destination so it can be moved atomically.
+        destination (str): Path the file is moved to.
+        mode (str): Mode to open the file with, "w" or "wb".
+    """
+    descriptor, temporary_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        encoding = None if "b" in mode else "utf-8"
+        with os.fdopen(descriptor, mode, encoding=encoding) as file:
+            yield file
+        os.replace(temporary_path, destination)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temporary_path)
+        raise
+
+
+def load_compiled_problem(
+    path: str = "data",
+) -> "Optional[tuple[dict[str, Course], dict[int, Student], dict[int, Hall], np.ndarray]]":
+    """Load a compiled problem from the data folder.
+
+    Args:
+        path (str): Path of the data folder. Defaults to "data".
+
+    Returns:
+        tuple | None: Courses, students, halls and the memory-mapped read-only
+            enrollment matrix. None if there is no compiled problem, or if it is
+            outdated or was compiled by another version.
+    """
+    folder = f"{path}/{CACHE_FOLDER}"
+    try:
+        with open(f"{folder}/metadata.json", encoding="utf-8") as file:
+            metadata = json.load(file)
+        if (
+            metadata["version"] != CACHE_VERSION
+            or metadata["source_hash"] != hash_source_files(path)
+        ):
+            return None
+        enrollment_matrix = np.load(f"{folder}/enrollment_matrix.npy", mmap_mode="r")
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if list(enrollment_matrix.shape) != metadata["shape"]:
+        return None
+
+    courses = {}
+    for course_data in metadata["courses"]:
+        course = Course(course_name=course_data["name"])
+        for activity_type in ACTIVITY_TYPES:
+            for category, capacity in course_data[activity_type]:
+                course.add_activity(
+                    activity_type,
+                    Activity(course=course, category=category, capacity=capacity),
+                )
+        courses[course.name] = course
+
+    students = {}
+    for index, first_name, last_name, student_number, course_names in metadata[
+        "students"
+    ]:
+        students[index] = Student(
+            index=index,
+            first_name=first_name,
+            last_name=last_name,
+            student_number=student_number,
+            courses={name: courses[name] for name in course_names},
+        )
+        for name in course_names:
+            courses[name].add_student(students[index])
+
+    halls = {
+        index: Hall(name, capacity)
+        for index, (name, capacity) in enumerate(metadata["halls"])
+    }
+
+    return courses, students, halls, enrollment_matrix
@@ -20,6 +20,8 @@ def to_csv(
         "iteration progression",
     ]
 
+    breakdown = model.get_penalty_breakdown()
+
     with open(
         f"{path}/{filename}_scores.csv", "a+", newline=""
     ) as score_file:
@@ -28,10 +30,9 @@ def to_csv(
                 {
                     fieldnames[0]: run,
                     fieldnames[1]: model.penalty_points,
-                    fieldnames[2]: model.calc_student_schedule_penalties()['conflict penalties'],
-                    fieldnames[3]: model.calc_student_schedule_penalties()['gap penalties'],
-                    fieldnames[3]: model.calc_total_capacity_penalties(),
-                    fieldnames[4]: model.calc_evening_penalties(),
+                    fieldnames[2]: breakdown.conflict,
+                    fieldnames[3]: breakdown.gap,
+                    fieldnames[4]: breakdown.capacity,
                     fieldnames[5]: round(runtime, 3),
                     fieldnames[6]: scores,
                 }
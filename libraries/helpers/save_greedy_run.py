@@ -3,13 +3,14 @@ import pandas as pd
 
 def to_csv(solution: Model, runtime, run, heuristic, filename, path='./results/Greedy/'):
     """Writes results of a run to a csv file."""
+    breakdown = solution.get_penalty_breakdown()
     list_of_dicts = [
         {'heuristic'      : heuristic,
-        'total penalty'   : solution.calc_total_penalty(),
-        'conflict penalty': solution.calc_student_schedule_penalties()['conflict penalties'],
-        'gap penalty'     : solution.calc_student_schedule_penalties()['gap penalties'],
-        'capacity penalty': solution.calc_total_capacity_penalties(),
-        'evening penalty' : solution.calc_evening_penalties(),
+        'total penalty'   : breakdown.total,
+        'conflict penalty': breakdown.conflict,
+        'gap penalty'     : breakdown.gap,
+        'capacity penalty': breakdown.capacity,
+        'evening penalty' : breakdown.evening,
         'runtime'         : runtime,
         'run_number'      : run}
     ]
@@ -1,24 +1,38 @@
+from typing import Optional
 from libraries.helpers.load_data import load_halls
 from libraries.classes.model import Model
+from libraries.classes.hall import Hall
+from libraries.classes.geometry import SlotGeometry, get_slot_geometry
 import pandas as pd
 import tkinter as tk
 from tkinter import ttk
 
 
-def create_df(schedule: dict) -> pd.DataFrame:
+def create_df(
+    schedule: dict,
+    geometry: Optional[SlotGeometry] = None,
+    halls: Optional[dict[int, Hall]] = None,
+) -> pd.DataFrame:
     """Takes a schedule dictionary and converts it to a pandas dataframe.
 
     Args:
-        schedule (dict): A schedule dictionary with indices 0-144 mapping to activity tuples or None.
+        schedule (dict): A schedule dictionary with indices mapping to activity tuples or None.
+        geometry (SlotGeometry): Geometry of the schedule. Defaults to None, in which
+            case the default geometry of the halls is used.
+        halls (dict[int, Hall]): Halls of the schedule. Defaults to None, in which
+            case the halls are loaded from the data folder.
 
     Return:
         pd.DataFrame: A dataframe with weekdays as column headers, timeslots as row headers and activities
             filled in the schedule on the correct day and timeslot.
     """
+    if halls is None:
+        halls = load_halls()
+    if geometry is None:
+        geometry = get_slot_geometry(tuple(hall.capacity for hall in halls.values()))
 
-    weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-    timeslots = ["9-11", "11-13", "13-15", "15-17", "17-19"]
-    halls = load_halls()
+    weekdays = list(geometry.day_names)
+    timeslots = list(geometry.timeslot_names)
 
     # Create an empty DataFrame
     df = pd.DataFrame(index=timeslots, columns=weekdays)
@@ -26,20 +40,10 @@ def create_df(schedule: dict) -> pd.DataFrame:
     # Iterate over the dictionary and populate the DataFrame
     for index, (course, lecture) in schedule.items():
         if course is not None and lecture is not None:
-            day = index // 29
-            timeslot_index = (index % 29) // 7
-            if (index % 29) == 28:
-                # Evening slot exception.
-                hall = 5
-            else:
-                # Regular hall indexing.
-                hall = (index % 29) % 7
-
-            # Map the timeslot index to the corresponding timeslot
-            timeslot = timeslots[timeslot_index]
-
-            # Map the location to the corresponding weekday
-            weekday = weekdays[day]
+            # Map the index to the corresponding timeslot, weekday and hall
+            timeslot = timeslots[geometry.timeslot_lookup[index]]
+            weekday = weekdays[geometry.day_lookup[index]]
+            hall = geometry.hall_lookup[index]
 
             value = f"{course}\n- {lecture}, {halls[hall]}"
 
@@ -106,8 +110,8 @@ def visualize_schedule(model: Model) -> None:
     """Visualizes a schedule in a pop up window.
 
     Args:
-        schedule (dict): A schedule dictionary with indices 0-144 that map to activity tuples.
+        model (Model): The model of which the schedule is shown.
     """
 
-    df = create_df(model.solution)
+    df = create_df(model.solution, model.geometry, model.halls)
     tkinter_pop_up(df)
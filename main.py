@@ -1,9 +1,5 @@
 from libraries.algorithms.randomise import Random
 from libraries.classes.model import Model
-from libraries.helpers.print_results import print_results
-from libraries.helpers.save_greedy_run import to_csv
-from libraries.helpers.score_histogram import plot_histogram
-from libraries.helpers.visualize import visualize_schedule
 from libraries.algorithms.greedy import Greedy, RandomGreedy
 from libraries.algorithms.beam_search import BeamSearch
 from libraries.algorithms.hillclimber import HillClimber
@@ -11,11 +7,28 @@ from libraries.algorithms.simulated_annealing import SimulatedAnnealing
 from libraries.algorithms.random_restart import random_restart
 import argparse
 import random
+import sys
 import time
 
-def main(algorithm, runs, heuristic, save, visualize):
+# Helpers depending on tabulate, pandas, matplotlib, scipy or tkinter are imported
+# where they are used, so runs that do not need them start faster.
+
+def print_results(algorithm_name, model, runtime):
+    """Print the schedule and penalties of the best model found by an algorithm."""
+    from libraries.helpers.print_results import print_results
+
+    print_results(algorithm_name, model, runtime)
+
+def visualize_schedule(model):
+    """Show the schedule of a model in a pop up window."""
+    from libraries.helpers.visualize import visualize_schedule
+
+    visualize_schedule(model)
+
+def main(algorithm, runs, heuristic, save, visualize, verify=0.0):
     random.seed(0)
     empty_model = Model()
+    empty_model.enable_verification(verify)
 
     algorithms = {
         "hillclimber": HillClimber,
@@ -57,7 +70,12 @@ def main(algorithm, runs, heuristic, save, visualize):
     elif algorithm in ["hillclimber", "simulated_annealing"]:
         start_time = time.time()
         best_model = random_restart(
-            algorithms[algorithm], heuristics=heuristic, verbose=2, runs=runs, save=save,
+            algorithms[algorithm],
+            heuristics=heuristic,
+            verbose=2,
+            runs=runs,
+            save=save,
+            empty_model=empty_model,
         )
         runtime = time.time() - start_time
 
@@ -90,6 +108,8 @@ def main(algorithm, runs, heuristic, save, visualize):
                 greedy_best = greedy_result.copy()
             
             if save:
+                from libraries.helpers.save_greedy_run import to_csv
+
                 to_csv(
                     greedy_result, runtime, run_number, heuristic,
                     filename=f"{algorithm}_{heuristic}_{runs}runs",
@@ -111,11 +131,13 @@ def main(algorithm, runs, heuristic, save, visualize):
         # Minimum number of runs with baseline is 100.
         with open(f"results/baseline_{runs*100}runs.txt", "a+") as file:
             for i in range(runs):
-                penalty = []
-                for j in range(100):
-                    random_schedule = Random(empty_model)
-                    penalty.append(random_schedule.run().calc_total_penalty())
-                    print(f"Current run cycle: {i}; {j} out of 100", end="\r")
+                # Generate 100 independent random schedules and score them at once.
+                schedules = Random(empty_model).generate_schedules(100)
+                penalty = [
+                    breakdown.total
+                    for breakdown in empty_model.calc_penalty_breakdowns(schedules)
+                ]
+                print(f"Current run cycle: {i}; 100 out of 100", end="\r")
 
                 text = "\n".join([str(score) for score in penalty])
                 file.write(f"\n{text}")
@@ -123,6 +145,8 @@ def main(algorithm, runs, heuristic, save, visualize):
         print(f'Baseline of {runs*100} runs finished. Results saved in ./results/baseline{runs*100}runs.txt')
         
         if save:
+            from libraries.helpers.score_histogram import plot_histogram
+
             plot_histogram(
                 data_file=f'./results/baseline_{runs*100}runs.txt', 
                 output_path='./images/', 
@@ -154,6 +178,27 @@ if __name__ == "__main__":
     parser.add_argument(
         "-v", "--visualize", action="store_true", help="visualizes schedule in pop up"
     )
+    parser.add_argument(
+        "--verify",
+        default=0.0,
+        type=float,
+        metavar="RATE",
+        help="checks this fraction of fast scores against a full calculation",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="runs the command and reports the slowest imports instead",
+    )
+
+    # report imports before parsing, so commands that exit early such as -h work too
+    if "--import-time" in sys.argv[1:]:
+        from libraries.helpers.import_time import report_import_times
+
+        report_import_times(
+            [__file__] + [arg for arg in sys.argv[1:] if arg != "--import-time"]
+        )
+        sys.exit()
 
     # read arguments from command line
     args = parser.parse_args()
@@ -165,4 +210,6 @@ if __name__ == "__main__":
         args.heuristics = args.heuristics[0]
 
     # run main with provided arguments
-    main(args.algorithm, args.n, args.heuristics, args.save, args.visualize)
\ No newline at end of file
+    main(
+        args.algorithm, args.n, args.heuristics, args.save, args.visualize, args.verify
+    )
\ No newline at end of file
@@ -0,0 +1,75 @@
+from libraries.classes.model import Model
+import random
+
+
+def expected_free_slots(model: Model) -> list[int]:
+    """Return the empty indices ordered by descending capacity, day and timeslot."""
+    capacity = model.geometry.capacity_lookup
+    empty = [
+        index
+        for index in range(model.geometry.n_slots)
+        if model.check_index_is_empty(index)
+    ]
+    return sorted(empty, key=lambda index: (-capacity[index], index))
+
+
+def check_free_slots(model: Model) -> None:
+    expected = expected_free_slots(model)
+    capacity = model.geometry.capacity_lookup
+
+    assert list(model.free_slots) == expected
+    assert len(model.free_slots) == len(expected)
+    assert all(index in model.free_slots for index in expected)
+    assert model.get_high_capacity_empty_index() == expected[0]
+    for min_capacity in sorted(set(capacity)) + [max(capacity) + 1]:
+        assert model.free_slots.count(min_capacity) == len(
+            [index for index in expected if capacity[index] >= min_capacity]
+        )
+
+
+def test_free_slots_follow_add_remove_and_swap():
+    random.seed(5)
+    model = Model()
+    check_free_slots(model)
+
+    for activity in range(len(model.activities)):
+        model.add_activity(model.get_random_index(empty=True), activity)
+        check_free_slots(model)
+
+    for _ in range(100):
+        model.swap_activities(*random.sample(range(model.geometry.n_slots), 2))
+        check_free_slots(model)
+
+    for activity in random.sample(range(len(model.activities)), 20):
+        model.remove_activity(activity)
+        check_free_slots(model)
+
+
+def test_random_empty_index_has_enough_capacity():
+    random.seed(6)
+    model = Model()
+    for activity in range(len(model.activities)):
+        model.add_activity(model.get_random_index(empty=True), activity)
+
+    for min_capacity in (0, 50, 100):
+        for _ in range(20):
+            index = model.get_random_empty_index_with_capacity(min_capacity)
+            assert model.check_index_is_empty(index)
+            if model.free_slots.count(min_capacity) > 0:
+                assert model.geometry.capacity_lookup[index] >= min_capacity
+
+
+def test_random_empty_index_matches_sorted_order():
+    random.seed(7)
+    model = Model()
+    for activity in range(len(model.activities)):
+        model.add_activity(model.get_random_index(empty=True), activity)
+    expected = expected_free_slots(model)
+    capacity = model.geometry.capacity_lookup
+
+    for min_capacity in (0, 30, 100):
+        candidates = [index for index in expected if capacity[index] >= min_capacity]
+        state = random.getstate()
+        index = model.free_slots.random(min_capacity)
+        random.setstate(state)
+        assert index == candidates[random.randrange(len(candidates))]
@@ -0,0 +1,25 @@
+from libraries.helpers.import_time import report_import_times
+import pytest
+
+
+def test_failing_command_exits_with_its_traceback(tmp_path, capsys):
+    script = tmp_path / "fails.py"
+    script.write_text("import json\nraise ValueError('broken script')\n")
+
+    with pytest.raises(SystemExit) as exit_info:
+        report_import_times([str(script)])
+
+    assert exit_info.value.code == 1
+    output = capsys.readouterr()
+    assert "ValueError: broken script" in output.err
+    assert "import time:" not in output.err
+    assert "Total import time" not in output.out
+
+
+def test_successful_command_reports_timings(tmp_path):
+    script = tmp_path / "works.py"
+    script.write_text("import json\n")
+
+    timings = report_import_times([str(script)], verbose=False)
+
+    assert "json" in [module for module, _, _ in timings]
@@ -0,0 +1,88 @@
+from libraries.helpers.load_data import load_courses, load_halls, load_students
+import pytest
+
+COURSES = (
+    "Vak,#Hoorcolleges,#Werkcolleges,Max. stud. Werkcollege,#Practica,"
+    "Max. stud. Practicum,Verwacht\n"
+    "Heuristieken,2,1,25.0,0,,40\n"
+)
+STUDENT_HEADER = "Achternaam,Voornaam,Stud.Nr.,Vak1,Vak2,Vak3,Vak4,Vak5\n"
+
+
+def write(path, file_name: str, text: str) -> None:
+    (path / file_name).write_text(text, encoding="utf-8")
+
+
+def test_load_valid_files(tmp_path):
+    write(tmp_path, "vakken.csv", COURSES)
+    write(
+        tmp_path,
+        "studenten_en_vakken.csv",
+        STUDENT_HEADER + "Jansen,Jan,1,Heuristieken,,,,\n",
+    )
+    write(tmp_path, "zalen.csv", "Zaalnummer,Max. capaciteit\nA1.04,41\n\nC0.110,117\n")
+
+    courses = load_courses(str(tmp_path))
+    students = load_students(courses, str(tmp_path))
+    halls = load_halls(str(tmp_path))
+
+    assert [activity.category for activity in courses["Heuristieken"].activities()] == [
+        "lecture 1",
+        "lecture 2",
+        "tutorial 1",
+    ]
+    assert list(students[0].courses) == ["Heuristieken"]
+    assert [(hall.name, hall.capacity) for hall in halls.values()] == [
+        ("A1.04", 41),
+        ("C0.110", 117),
+    ]
+
+
+def test_non_integer_value_reports_line(tmp_path):
+    write(tmp_path, "zalen.csv", "Zaalnummer,Max. capaciteit\nA1.04,41\nA1.06,many\n")
+
+    with pytest.raises(
+        Exception, match=r"zalen\.csv:3: 'many' in column 'Max\. capaciteit'"
+    ):
+        load_halls(str(tmp_path))
+
+
+def test_wrong_number_of_values_reports_line(tmp_path):
+    write(tmp_path, "zalen.csv", "Zaalnummer,Max. capaciteit\nA1.04,41,3\n")
+
+    with pytest.raises(Exception, match=r"zalen\.csv:2: expected 2 values, found 3"):
+        load_halls(str(tmp_path))
+
+
+def test_missing_column_reports_header(tmp_path):
+    write(tmp_path, "zalen.csv", "Zaalnummer\nA1.04\n")
+
+    with pytest.raises(
+        Exception, match=r"zalen\.csv:1: missing column\(s\) Max\. capaciteit"
+    ):
+        load_halls(str(tmp_path))
+
+
+def test_unknown_course_reports_line(tmp_path):
+    write(tmp_path, "vakken.csv", COURSES)
+    write(
+        tmp_path,
+        "studenten_en_vakken.csv",
+        STUDENT_HEADER
+        + "Jansen,Jan,1,Heuristieken,,,,\n"
+        + "Smit,Sanne,2,Heuristieken,Sterrenkunde,,,\n",
+    )
+
+    with pytest.raises(
+        Exception, match=r"studenten_en_vakken\.csv:3: unknown course 'Sterrenkunde'"
+    ):
+        load_students(load_courses(str(tmp_path)), str(tmp_path))
+
+
+def test_duplicate_course_reports_line(tmp_path):
+    write(tmp_path, "vakken.csv", COURSES + "Heuristieken,1,0,,0,,10\n")
+
+    with pytest.raises(
+        Exception, match=r"vakken\.csv:3: course 'Heuristieken' occurs twice"
+    ):
+        load_courses(str(tmp_path))
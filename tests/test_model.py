@@ -0,0 +1,180 @@
+from libraries.algorithms.randomise import Random
+from libraries.classes.model import Model
+import numpy as np
+import random
+
+
+def test_penalty_tables_refreshed_after_score_cache_hit():
+    model = Model()
+    for activity in range(10):
+        model.add_activity(activity, activity)
+    model.get_penalty_points()
+
+    # Move an activity to an empty index and back, the last score is a cache hit.
+    empty_index = model.geometry.n_slots - 1
+    model.swap_activities(0, empty_index)
+    model.get_penalty_points()
+    model.swap_activities(0, empty_index)
+    hits = model.score_cache.hits
+    model.get_penalty_points()
+    assert model.score_cache.hits == hits + 1
+
+    reference = model.copy()
+    reference.calc_total_penalty()
+    extremes = model.get_penalty_extremes(3)
+    assert extremes == reference.get_penalty_extremes(3)
+    assert all(not model.check_index_is_empty(index) for index in extremes)
+    assert np.array_equal(model.penalty_per_index, reference.penalty_per_index)
+    assert model.get_worst_days() == reference.get_worst_days()
+    assert model.get_penalties_per_day("gap penalties") == reference.get_penalties_per_day(
+        "gap penalties"
+    )
+
+
+def test_apply_swaps_hits_score_cache_on_revisited_schedule():
+    model = Random(Model()).run()
+    model.calc_total_penalty()
+    start_hash, start_penalty = model.zobrist_hash, model.penalty_points
+
+    # Swap two occupied indices and back, the second swap revisits the start.
+    occupied = [index for index in range(10) if not model.check_index_is_empty(index)]
+    swap = (occupied[0], occupied[1])
+    model.apply_swaps([swap])
+    hits = model.score_cache.hits
+    assert model.apply_swaps([swap]) == start_penalty
+    assert model.zobrist_hash == start_hash
+    assert model.score_cache.hits == hits + 1
+
+    reference = model.copy()
+    reference.calc_total_penalty()
+    assert np.array_equal(model.penalty_per_index, reference.penalty_per_index)
+    assert np.array_equal(
+        model.student_gap_penalties, reference.student_gap_penalties
+    )
+
+    # A revisited schedule that reaches max_delta is rejected on its memoised score.
+    swapped_penalty = model.apply_swaps([swap])
+    model.apply_swaps([swap])
+    hits = model.score_cache.hits
+    model.begin()
+    result = model.apply_swaps([swap], swapped_penalty - start_penalty)
+    model.rollback()
+    assert result is None
+    assert model.score_cache.hits == hits + 1
+    assert model.zobrist_hash == start_hash
+    assert model.penalty_points == start_penalty
+
+
+def test_batched_student_penalties_match_per_student_calculation():
+    random.seed(0)
+    for _ in range(3):
+        model = Random(Model()).run()
+
+        batched = model.calc_student_schedule_penalties()
+        conflicts = model.student_conflict_penalties.copy()
+        gaps = model.student_gap_penalties.copy()
+        per_student = model.calc_student_schedule_penalties_per_student()
+
+        assert batched == per_student
+        assert np.array_equal(conflicts, model.student_conflict_penalties)
+        assert np.array_equal(gaps, model.student_gap_penalties)
+
+
+def test_rollback_restores_model_after_several_swaps():
+    random.seed(1)
+    model = Random(Model()).run()
+    model.calc_total_penalty()
+    before = model.copy()
+    free_slots = list(model.free_slots)
+
+    model.begin()
+    for _ in range(5):
+        model.apply_swaps([tuple(random.sample(range(model.geometry.n_slots), 2))])
+    model.apply_swaps(
+        [tuple(random.sample(range(model.geometry.n_slots), 2)) for _ in range(3)]
+    )
+    model.rollback()
+
+    assert model.undo_log is None
+    assert np.array_equal(model.schedule, before.schedule)
+    assert np.array_equal(model.activity_slots, before.activity_slots)
+    assert model.zobrist_hash == before.zobrist_hash == model.calc_zobrist_hash()
+    assert list(model.free_slots) == free_slots
+    assert model.penalty_breakdown == before.penalty_breakdown
+    assert model.penalty_points == before.penalty_points
+    assert np.array_equal(model.penalty_per_index, before.penalty_per_index)
+    assert np.array_equal(
+        model.student_conflict_penalties, before.student_conflict_penalties
+    )
+    assert np.array_equal(model.student_gap_penalties, before.student_gap_penalties)
+
+
+def test_swap_deltas_match_full_recalculation():
+    random.seed(2)
+    model = Random(Model()).run()
+    penalty = model.calc_total_penalty()
+
+    for _ in range(50):
+        swaps = [
+            tuple(random.sample(range(model.geometry.n_slots), 2))
+            for _ in range(random.randint(1, 3))
+        ]
+        delta = model.calc_swaps_delta(swaps)
+        assert model.penalty_points == penalty
+
+        new_penalty = model.apply_swaps(swaps)
+        reference = model.copy()
+        assert new_penalty == penalty + delta == reference.calc_total_penalty()
+        assert model.penalty_breakdown == reference.penalty_breakdown
+        assert np.array_equal(model.penalty_per_index, reference.penalty_per_index)
+        assert np.array_equal(
+            model.student_conflict_penalties, reference.student_conflict_penalties
+        )
+        assert np.array_equal(
+            model.student_gap_penalties, reference.student_gap_penalties
+        )
+        penalty = new_penalty
+
+
+def test_apply_swaps_stops_early_at_max_delta():
+    random.seed(3)
+    model = Random(Model()).run()
+    penalty = model.calc_total_penalty()
+
+    for _ in range(50):
+        swaps = [tuple(random.sample(range(model.geometry.n_slots), 2))]
+        delta = model.calc_swaps_delta(swaps)
+        start_hash = model.zobrist_hash
+        breakdown = model.penalty_breakdown
+
+        # Evaluate every move anew, not from the score memo.
+        model.score_cache.clear()
+        model.begin()
+        assert model.apply_swaps(swaps, max_delta=delta) is None
+        assert model.zobrist_hash == start_hash
+        assert model.penalty_breakdown == breakdown
+        assert model.apply_swaps(swaps, max_delta=delta + 1) == penalty + delta
+        model.rollback()
+
+        assert model.zobrist_hash == start_hash
+        assert model.penalty_points == penalty
+
+
+def test_batch_scores_match_per_model_scores():
+    random.seed(4)
+    empty_model = Model()
+    schedules = Random(empty_model).generate_schedules(7)
+
+    # A batch size below the number of schedules scores them in several batches.
+    breakdowns = empty_model.calc_penalty_breakdowns(schedules, batch_size=3)
+
+    assert len(breakdowns) == len(schedules)
+    for schedule, breakdown in zip(schedules, breakdowns):
+        model = empty_model.copy()
+        model.load_schedule(schedule)
+        model.calc_total_penalty()
+        assert breakdown == model.penalty_breakdown
+        assert model.calc_student_schedule_penalties_per_student() == {
+            "conflict penalties": breakdown.conflict,
+            "gap penalties": breakdown.gap,
+        }
@@ -0,0 +1,54 @@
+from libraries.classes.penalty_tables import DayPenaltyTables
+from libraries.classes.model import Model
+from itertools import combinations_with_replacement
+import numpy as np
+
+
+def baseline_conflict_penalty(daily_schedule: list[int]) -> int:
+    """Conflict penalty as counted before the lookup tables."""
+    return len(
+        [element for element in daily_schedule if daily_schedule.count(element) > 1]
+    )
+
+
+def baseline_gap_penalty(daily_schedule: list[int], third_gap_penalty: int = 5) -> int:
+    """Gap penalty as counted before the lookup tables."""
+    gap_penalty_map = {0: 0, 1: 1, 2: 3, 3: third_gap_penalty}
+    penalty_schedule = np.diff(np.sort(list(set(daily_schedule)))) - 1
+    return gap_penalty_map[sum(penalty_schedule)]
+
+
+def daily_schedules(n_timeslots: int = 5, max_activities: int = 6):
+    """Yield every multiset of timeslots of up to max_activities activities."""
+    for n_activities in range(max_activities + 1):
+        for timeslots in combinations_with_replacement(range(n_timeslots), n_activities):
+            yield list(timeslots)
+
+
+def test_day_penalties_match_baseline():
+    tables = DayPenaltyTables(5)
+    for daily_schedule in daily_schedules():
+        # The order of the activities in a day does not matter.
+        for timeslots in (daily_schedule, daily_schedule[::-1]):
+            assert tables.calc_day_penalties(timeslots) == (
+                baseline_conflict_penalty(timeslots),
+                baseline_gap_penalty(timeslots),
+            )
+
+
+def test_third_gap_penalty_is_configurable():
+    tables = DayPenaltyTables(5, third_gap_penalty=7)
+    assert tables.calc_day_penalties([0, 4]) == (0, baseline_gap_penalty([0, 4], 7))
+
+
+def test_vectorised_day_penalties_match_baseline():
+    model = Model()
+    schedules = list(daily_schedules())
+    occupancy = np.zeros((len(schedules), 5), dtype=int)
+    for row, daily_schedule in enumerate(schedules):
+        np.add.at(occupancy[row], daily_schedule, 1)
+
+    conflicts, gaps = model.calc_student_day_penalties(occupancy)
+
+    assert conflicts.tolist() == [baseline_conflict_penalty(day) for day in schedules]
+    assert gaps.tolist() == [baseline_gap_penalty(day) for day in schedules]
@@ -0,0 +1,80 @@
+from libraries.classes.problem_instance import ProblemInstance
+from libraries.helpers import problem_cache
+from libraries.helpers.problem_cache import (
+    CACHE_FOLDER,
+    SOURCE_FILES,
+    load_compiled_problem,
+    save_compiled_problem,
+)
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import os
+import pytest
+import shutil
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    """Return a copy of the data folder without a compiled problem."""
+    for file_name in SOURCE_FILES:
+        shutil.copy(f"data/{file_name}", tmp_path / file_name)
+    return str(tmp_path)
+
+
+def test_compiled_problem_matches_csv_files(data_path):
+    assert load_compiled_problem(data_path) is None
+    instance = ProblemInstance(data_path)
+
+    compiled = ProblemInstance(data_path)
+    reference = ProblemInstance(data_path, use_cache=False)
+
+    assert load_compiled_problem(data_path) is not None
+    assert np.array_equal(compiled.enrollment_matrix, reference.enrollment_matrix)
+    assert np.array_equal(instance.enrollment_matrix, reference.enrollment_matrix)
+    assert compiled.activities == reference.activities
+    assert compiled.student_activities == reference.student_activities
+    assert [hall.capacity for hall in compiled.halls.values()] == [
+        hall.capacity for hall in reference.halls.values()
+    ]
+
+
+def test_compiled_problem_is_ignored_after_csv_change(data_path):
+    n_halls = len(ProblemInstance(data_path).halls)
+
+    with open(f"{data_path}/zalen.csv", "a", encoding="utf-8") as file:
+        file.write("\nX.99,10\n")
+
+    assert load_compiled_problem(data_path) is None
+    # Loading rebuilds the compiled problem from the changed csv files.
+    assert len(ProblemInstance(data_path).halls) == n_halls + 1
+    assert len(load_compiled_problem(data_path)[2]) == n_halls + 1
+
+
+def test_compiled_problem_is_ignored_after_version_bump(data_path, monkeypatch):
+    ProblemInstance(data_path)
+
+    monkeypatch.setattr(problem_cache, "CACHE_VERSION", problem_cache.CACHE_VERSION + 1)
+
+    assert load_compiled_problem(data_path) is None
+
+
+def test_concurrent_saves_do_not_share_temporary_files(data_path):
+    instance = ProblemInstance(data_path, use_cache=False)
+    data = (instance.courses, instance.students, instance.halls)
+
+    with ThreadPoolExecutor(8) as executor:
+        saves = [
+            executor.submit(
+                save_compiled_problem, *data, instance.enrollment_matrix, data_path
+            )
+            for _ in range(16)
+        ]
+        for save in saves:
+            save.result()
+
+    assert sorted(os.listdir(f"{data_path}/{CACHE_FOLDER}")) == [
+        "enrollment_matrix.npy",
+        "metadata.json",
+    ]
+    compiled = load_compiled_problem(data_path)
+    assert np.array_equal(compiled[3], instance.enrollment_matrix)
@@ -0,0 +1,34 @@
+from libraries.classes.problem_instance import ProblemInstance
+import numpy as np
+import pytest
+
+
+def test_grid_with_fewer_indices_than_activities_raises():
+    with pytest.raises(Exception, match="too few for 72 activities"):
+        ProblemInstance(n_days=2, n_timeslots=4)
+
+
+def test_grid_with_enough_indices_is_accepted():
+    instance = ProblemInstance(n_days=3, n_timeslots=5)
+    assert instance.geometry.n_slots >= len(instance.activities)
+
+
+def test_activity_students_are_indexed_by_activity_id():
+    instance = ProblemInstance()
+    assert len(instance.activity_students) == len(instance.activities)
+    for activity_id, activity in enumerate(instance.activities):
+        assert instance.activity_students[activity_id] == (
+            instance.activity_enrollments[activity]
+        )
+        assert len(instance.activity_students[activity_id]) == (
+            instance.activity_sizes[activity_id]
+        )
+
+
+def test_float32_enrollment_matrix_is_shared_and_read_only():
+    instance = ProblemInstance()
+    matrix = instance.enrollment_matrix_float32
+
+    assert matrix.dtype == np.float32
+    assert not matrix.flags.writeable
+    assert np.array_equal(matrix, instance.enrollment_matrix)
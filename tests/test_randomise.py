@@ -0,0 +1,12 @@
+from libraries.algorithms.randomise import Random
+from libraries.classes.model import Model
+
+
+def test_run_without_runs_returns_initial_model():
+    random_algorithm = Random(Model())
+
+    best_model = random_algorithm.run(runs=0)
+
+    assert best_model is random_algorithm.initial_model
+    assert len(best_model.unassigned_activities) == len(best_model.activities)
+    assert best_model.penalty_points == float("inf")
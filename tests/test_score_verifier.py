@@ -0,0 +1,37 @@
+from libraries.algorithms.hillclimber import HillClimber
+from libraries.algorithms.random_restart import random_restart
+from libraries.algorithms.randomise import Random
+from libraries.classes.model import Model
+import pytest
+
+
+def test_random_restart_samples_with_verification():
+    empty_model = Model()
+    empty_model.enable_verification(1.0)
+
+    random_restart(HillClimber, runs=1, iterations=50, empty_model=empty_model)
+
+    assert empty_model.verifier.checks > 0
+
+
+def test_verifier_raises_on_corrupted_score():
+    model = Random(Model()).run()
+    model.enable_verification(1.0)
+    model.calc_total_penalty()
+    model.penalty_breakdown = model.penalty_breakdown + model.penalty_breakdown
+
+    with pytest.raises(Exception, match="does not match a full recalculation"):
+        model.apply_swaps([(0, 1)])
+
+
+def test_verification_leaves_score_cache_unchanged():
+    model = Random(Model()).run()
+    model.calc_total_penalty()
+    model.enable_verification(1.0)
+    cache = model.score_cache
+    size, hits, misses = len(cache), cache.hits, cache.misses
+
+    model.verifier.verify(model, model.penalty_breakdown, "no move")
+
+    assert model.verifier.checks == 1
+    assert (len(cache), cache.hits, cache.misses) == (size, hits, misses)